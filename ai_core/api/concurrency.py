@@ -0,0 +1,188 @@
+"""
+concurrency.py
+
+Load control for the API:
+- SingleFlight: identical concurrent lookups share one in-flight call
+- AdmissionController: bounded concurrency with per-request deadlines
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Union
+
+
+# -----------------------------
+# Request Coalescing
+# -----------------------------
+
+class Flight:
+    """
+    One shared call and the deadlines of the callers waiting on it.
+    """
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.deadlines: List[float] = []
+        # Set by the call once it holds a slot; from then on it runs
+        # to completion even if every caller gives up.
+        self.started = False
+
+    @property
+    def deadline(self) -> float:
+        """
+        Latest deadline among the current waiters.
+        """
+        return max(self.deadlines, default=float("-inf"))
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time.
+    Callers arriving while a call is in flight await its result
+    instead of starting their own.
+
+    fn receives the Flight, so it can admit itself under the
+    waiters' deadline. A call that has not started yet is cancelled
+    when its last waiter gives up.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[Flight], Awaitable[Any]],
+        deadline: float = float("inf"),
+    ) -> Any:
+        flight = self._inflight.get(key)
+
+        if flight is None:
+            flight = Flight()
+            flight.task = asyncio.ensure_future(fn(flight))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(lambda t: self._finished(key, flight, t))
+
+        flight.deadlines.append(deadline)
+        try:
+            # A caller giving up (deadline, disconnect) must not cancel
+            # the shared call for the others still waiting.
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.deadlines.remove(deadline)
+            if not flight.deadlines and not flight.started and not flight.task.done():
+                # Nobody is waiting: drop it from the queue
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: Flight) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    def _finished(self, key: Hashable, flight: Flight, task: asyncio.Task) -> None:
+        self._forget(key, flight)
+        # Retrieve the outcome so an abandoned failure isn't reported
+        # as "exception was never retrieved"
+        if not task.cancelled():
+            task.exception()
+
+
+# -----------------------------
+# Admission Control
+# -----------------------------
+
+class AdmissionRejected(Exception):
+    """
+    The request cannot be served within its deadline.
+    """
+
+
+class AdmissionController:
+    """
+    Limits concurrent lookups and sheds requests that can no longer
+    meet their deadline, instead of queueing them without bound.
+
+    Deadlines are absolute event-loop times (loop.time()), or a
+    callable returning one for deadlines that can move while queued
+    (e.g. lambda: flight.deadline).
+    """
+
+    def __init__(self, max_concurrency: int, max_queue: int):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._waiting = 0
+        self._active = 0
+
+        # Smoothed service time, used to reject early
+        self.service_time = 0.0
+        self._alpha = 0.2
+
+    @staticmethod
+    def now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def deadline_after(self, timeout: float) -> float:
+        return self.now() + timeout
+
+    def remaining(self, deadline: float) -> float:
+        return deadline - self.now()
+
+    def _check(self, deadline: float) -> float:
+        remaining = self.remaining(deadline)
+
+        # When idle, let one request through regardless of the estimate,
+        # so a stale (slow) service time can recover.
+        budget = self.service_time if self._active else 0.0
+
+        if remaining <= budget:
+            raise AdmissionRejected(
+                "Request cannot complete before its deadline"
+            )
+        return remaining
+
+    def _record(self, duration: float) -> None:
+        self.service_time += self._alpha * (duration - self.service_time)
+
+    @asynccontextmanager
+    async def admit(self, deadline: Union[float, Callable[[], float]]):
+        current_deadline = deadline if callable(deadline) else lambda: deadline
+
+        remaining = self._check(current_deadline())
+
+        if self._semaphore.locked() and self._waiting >= self.max_queue:
+            raise AdmissionRejected("Too many queued requests")
+
+        self._waiting += 1
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._semaphore.acquire(), remaining)
+                    break
+                except asyncio.TimeoutError:
+                    # A caller joining meanwhile may have extended it
+                    remaining = self.remaining(current_deadline())
+                    if remaining <= 0:
+                        raise AdmissionRejected(
+                            "Deadline expired while waiting for a slot"
+                        ) from None
+        finally:
+            self._waiting -= 1
+
+        try:
+            # Time spent queued may have used up the budget
+            self._check(current_deadline())
+
+            self._active += 1
+            started = self.now()
+            try:
+                yield
+            finally:
+                self._active -= 1
+            self._record(self.now() - started)
+        finally:
+            self._semaphore.release()
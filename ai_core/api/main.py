@@ -107,13 +107,48 @@
 
 
 
+import asyncio
+import time
+
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import PlainTextResponse, Response
+from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any
 
-from ai_core.tools.query_router import handle_user_query
+from ai_core.api.concurrency import (
+    AdmissionController,
+    AdmissionRejected,
+    SingleFlight,
+)
+from ai_core.api.profiler import SamplingProfiler, folded_stacks
+from ai_core.api.slow_query_log import SlowQueryLog
+from ai_core.config.settings import (
+    DEBUG_ENDPOINTS,
+    PRERENDERED_RESPONSES,
+    QUERY_DEADLINE_MS,
+    QUERY_MAX_CONCURRENCY,
+    QUERY_MAX_QUEUE,
+    RANKED_RESULTS,
+    SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS,
+    SLOW_QUERY_LOG_PATH,
+    SLOW_QUERY_THRESHOLD_MS,
+)
+from ai_core.db.mongo.schemas import dumps_json
+from ai_core.tools.intent_parser import parse_intent
+from ai_core.tools.query_router import (
+    build_rendered_payload,
+    build_response_payload,
+    canonical_filters_key,
+    explain_for_filters,
+    search_for_filters,
+    search_for_filters_rendered,
+)
+from ai_core.tools.reply_builder import build_reply_text
+
+
+QUERY_LIMIT = 5
 
 
 # --- 1. Define Data Models ---
@@ -121,6 +156,7 @@ class QueryRequest(BaseModel):
     text: str
     session_id: Optional[str] = "default"
     user_id: Optional[str] = "guest"
+    deadline_ms: Optional[int] = Field(None, gt=0)  # capped at QUERY_DEADLINE_MS
 
 
 class QueryResponse(BaseModel):
@@ -137,6 +173,23 @@ app = FastAPI(
 )
 
 
+# Identical concurrent lookups share one database round trip;
+# lookups beyond the concurrency limit queue briefly or are shed.
+single_flight = SingleFlight()
+admission = AdmissionController(
+    max_concurrency=QUERY_MAX_CONCURRENCY,
+    max_queue=QUERY_MAX_QUEUE,
+)
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=SLOW_QUERY_THRESHOLD_MS,
+    path=SLOW_QUERY_LOG_PATH,
+    explain=explain_for_filters,
+    explain_cooldown_seconds=SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS,
+)
+profiler = SamplingProfiler()
+
+
 # --- 3. CORS Policy ---
 app.add_middleware(
     CORSMiddleware,
@@ -162,31 +215,142 @@ async def process_query(request: QueryRequest):
     """
     print(f"🔹 Received Query: {request.text}")
 
+    timeout_ms = min(request.deadline_ms or QUERY_DEADLINE_MS, QUERY_DEADLINE_MS)
+    deadline = admission.deadline_after(timeout_ms / 1000)
+
+    started = time.perf_counter()
+    filters = None
+    status = 500
+
     try:
-        result = handle_user_query(request.text, limit=5)
+        filters = await asyncio.to_thread(parse_intent, request.text)
 
-        if result["result_count"] == 0:
-            reply = (
-                "I couldn’t find any exact matches for your request. "
-                "Would you like to broaden the criteria?"
-            )
-        else:
-            reply = (
-                f"I found {result['result_count']} matching properties. "
-                "Here are some good options."
+        if PRERENDERED_RESPONSES:
+            fragments = await _coalesced_search(
+                search_for_filters_rendered, filters, deadline
             )
+            status = 200
+            return _prerendered_response(request.text, filters, fragments)
+
+        results = await _coalesced_search(search_for_filters, filters, deadline)
+
+        result = build_response_payload(request.text, filters, results)
+
+        reply = build_reply_text(result["result_count"])
 
+        status = 200
         return QueryResponse(
             status="success",
             reply_text=reply,
             data=result
         )
 
+    except AdmissionRejected as e:
+        status = 503
+        raise HTTPException(
+            status_code=503, detail=str(e), headers={"Retry-After": "1"}
+        )
+
+    except asyncio.TimeoutError:
+        status = 504
+        raise HTTPException(status_code=504, detail="Query deadline exceeded")
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        # Shed requests never reached the database, nothing to explain
+        reached_db = filters is not None and status != 503
+
+        if reached_db and slow_query_log.is_slow(elapsed_ms):
+            slow_query_log.submit(
+                request.text, filters, elapsed_ms,
+                limit=QUERY_LIMIT, rank=RANKED_RESULTS, status=status,
+            )
+
+
+async def _coalesced_search(search, filters: Dict[str, Any], deadline: float):
+    """
+    Runs a blocking search off the event loop, behind admission control,
+    shared with any identical lookup already in flight.
+
+    The shared call is admitted under the latest deadline among the
+    callers still waiting on it, and leaves the queue once they have
+    all given up.
+    """
+    key = (
+        search.__name__,
+        canonical_filters_key(filters, QUERY_LIMIT, RANKED_RESULTS),
+    )
+
+    async def run(flight):
+        async with admission.admit(lambda: flight.deadline):
+            flight.started = True
+            return await asyncio.to_thread(
+                search, filters, limit=QUERY_LIMIT, rank=RANKED_RESULTS
+            )
+
+    return await asyncio.wait_for(
+        single_flight.do(key, run, deadline), admission.remaining(deadline)
+    )
+
+
+def _prerendered_response(text: str, filters: Dict[str, Any], fragments) -> Response:
+    """
+    Assembles the QueryResponse JSON from pre-rendered fragments,
+    skipping model validation and re-serialization.
+    """
+    body = b"".join([
+        b'{"status":"success","reply_text":',
+        dumps_json(build_reply_text(len(fragments))),
+        b',"data":', build_rendered_payload(text, filters, fragments), b"}",
+    ])
+
+    return Response(content=body, media_type="application/json")
+
+
+# --- 6. Debug Endpoints ---
+def _require_debug():
+    if not DEBUG_ENDPOINTS:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+@app.get("/debug/slow-queries")
+async def recent_slow_queries():
+    _require_debug()
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "entries": slow_query_log.recent(),
+    }
+
+
+@app.get("/debug/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(10, gt=0, le=120),
+    interval_ms: float = Query(5, ge=1, le=1000),
+):
+    """
+    Samples all threads for `seconds` and returns folded stacks,
+    ready for flamegraph.pl / speedscope.
+    """
+    _require_debug()
+
+    try:
+        profiler.start(interval_ms / 1000)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        stacks = await asyncio.to_thread(profiler.stop)
+
+    return PlainTextResponse(folded_stacks(stacks))
+
 
-# --- 6. Entry Point ---
+# --- 7. Entry Point ---
 if __name__ == "__main__":
     uvicorn.run(
         "ai_core.api.main:app",
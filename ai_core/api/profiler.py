@@ -0,0 +1,93 @@
+"""
+profiler.py
+
+Sampling profiler for the running API process.
+
+Samples every thread's Python stack at a fixed interval and aggregates
+them in the folded format used by flame graph tools
+(flamegraph.pl, speedscope, inferno):
+
+    main.py:process_query;query_router.py:search_for_filters;... 42
+"""
+
+import os
+import sys
+import threading
+from collections import Counter
+from typing import Dict
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class SamplingProfiler:
+    """
+    Start / stop at runtime; only one profile can run at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stacks: Counter = Counter()
+        self.samples = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self, interval: float = 0.005) -> None:
+        with self._lock:
+            if self._thread is not None:
+                raise RuntimeError("Profiler is already running")
+
+            self._stacks = Counter()
+            self.samples = 0
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._sample_loop,
+                args=(interval,),
+                name="sampling-profiler",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> Dict[str, int]:
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return {}
+
+            self._stop.set()
+            thread.join()
+            self._thread = None
+
+        return dict(self._stacks)
+
+    def _sample_loop(self, interval: float) -> None:
+        own_id = threading.get_ident()
+
+        while not self._stop.wait(interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+
+                self._stacks[";".join(reversed(stack))] += 1
+
+            self.samples += 1
+
+
+def folded_stacks(stacks: Dict[str, int]) -> str:
+    """
+    One 'frame;frame;frame count' line per distinct stack.
+    """
+    lines = sorted(stacks.items(), key=lambda item: -item[1])
+    return "".join(f"{stack} {count}\n" for stack, count in lines)
+
@@ -0,0 +1,131 @@
+"""
+slow_query_log.py
+
+Records /query calls slower than a threshold, with everything needed
+to reproduce them: raw text, parsed filters, the generated MongoDB
+query and an explain("executionStats") summary.
+
+Explains re-run the query, so each lookup is explained at most once
+per cooldown; repeats in between are logged without one.
+
+Entries are appended to a JSON-lines file and kept in memory
+for the /debug/slow-queries endpoint.
+"""
+
+import asyncio
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Set
+
+from ai_core.db.mongo.schemas import dumps_json
+from ai_core.tools.query_router import canonical_filters_key, query_for_filters
+
+
+class SlowQueryLog:
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        path: str | None,
+        explain: Callable[..., Dict[str, Any]],
+        explain_cooldown_seconds: float = 60.0,
+        max_entries: int = 100,
+    ):
+        self.threshold_ms = threshold_ms
+        self.path = path
+        self.explain = explain
+        self.explain_cooldown_seconds = explain_cooldown_seconds
+
+        self._entries: deque = deque(maxlen=max_entries)
+        # Lookups being explained right now (a spike of one slow query
+        # should cost one explain, not one per request)
+        self._inflight: Set[str] = set()
+        # Lookup key -> monotonic time of its last explain
+        self._explained_at: Dict[str, float] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def is_slow(self, elapsed_ms: float) -> bool:
+        return elapsed_ms >= self.threshold_ms
+
+    def recent(self) -> List[Dict[str, Any]]:
+        return list(self._entries)
+
+    def submit(
+        self,
+        text: str,
+        filters: Dict[str, Any],
+        elapsed_ms: float,
+        limit: int,
+        rank: bool,
+        status: int = 200,
+    ) -> None:
+        """
+        Records the entry in the background, off the request path.
+        """
+        key = canonical_filters_key(filters, limit, rank)
+
+        explain = self._claim_explain(key)
+
+        task = asyncio.create_task(asyncio.to_thread(
+            self._record, key, explain, text, filters, elapsed_ms, limit, rank, status
+        ))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _claim_explain(self, key: str) -> bool:
+        """
+        True if this entry should run an explain: none in flight for
+        the lookup and none within the cooldown.
+        """
+        now = time.monotonic()
+
+        if key in self._inflight:
+            return False
+        last = self._explained_at.get(key)
+        if last is not None and now - last < self.explain_cooldown_seconds:
+            return False
+
+        # Forget lookups whose cooldown is over, so the map stays small
+        if len(self._explained_at) >= 1000:
+            self._explained_at = {
+                k: t for k, t in self._explained_at.items()
+                if now - t < self.explain_cooldown_seconds
+            }
+
+        self._inflight.add(key)
+        self._explained_at[key] = now
+        return True
+
+    def _record(self, key, explain, text, filters, elapsed_ms, limit, rank, status):
+        entry: Dict[str, Any] = {
+            "at": datetime.utcnow().isoformat(timespec="milliseconds"),
+            "elapsed_ms": round(elapsed_ms, 1),
+            "status": status,
+            "text": text,
+            "filters": filters,
+            "limit": limit,
+            "rank": rank,
+        }
+
+        # Always reproducible, even when the explain is skipped or fails
+        try:
+            entry["query"] = query_for_filters(filters)
+        except Exception as exc:
+            entry["query_error"] = str(exc)
+
+        if explain:
+            try:
+                entry["explain"] = self.explain(filters, limit=limit, rank=rank)["explain"]
+            except Exception as exc:
+                entry["explain_error"] = str(exc)
+            finally:
+                self._inflight.discard(key)
+        else:
+            entry["explain_skipped"] = "explained recently"
+
+        self._entries.append(entry)
+
+        if self.path:
+            with open(self.path, "ab") as f:
+                f.write(dumps_json(entry) + b"\n")
@@ -0,0 +1,207 @@
+"""
+test_concurrency.py
+
+Checks SingleFlight and AdmissionController: sharing, queue overflow,
+expiry in the queue, callers with different deadlines sharing a call,
+and abandoned calls leaving the queue.
+
+No database needed.
+Run from the repo root: python -m ai_core.api.test_concurrency
+"""
+
+import asyncio
+import sys
+
+from ai_core.api.concurrency import AdmissionController, SingleFlight
+
+
+def check(label: str, ok: bool) -> bool:
+    print(f"  {'✔' if ok else '✘'} {label}")
+    return ok
+
+
+async def outcome(awaitable):
+    try:
+        return await awaitable
+    except Exception as e:
+        return type(e).__name__
+
+
+async def hold(admission: AdmissionController, deadline: float, seconds: float):
+    async with admission.admit(deadline):
+        await asyncio.sleep(seconds)
+    return "served"
+
+
+def admitted_lookup(admission: AdmissionController, calls: list, seconds: float = 0.05):
+    """
+    Same shape as /query's shared call: admitted under the waiters' deadline.
+    """
+    async def lookup(flight):
+        async with admission.admit(lambda: flight.deadline):
+            flight.started = True
+            calls.append(1)
+            await asyncio.sleep(seconds)
+            return "result"
+
+    return lookup
+
+
+async def check_sharing() -> int:
+    print("single flight")
+    single_flight = SingleFlight()
+    calls = []
+
+    async def lookup(flight):
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(*(single_flight.do("k", lookup) for _ in range(5)))
+
+    failures = 0
+    failures += not check("identical lookups share one call", len(calls) == 1)
+    failures += not check("every caller gets the result", results == ["result"] * 5)
+    failures += not check("key released when done", len(single_flight) == 0)
+
+    # A caller timing out must not cancel the call for the others
+    calls.clear()
+    early = asyncio.wait_for(single_flight.do("k", lookup), 0.01)
+    late = single_flight.do("k", lookup)
+    early_result, late_result = await asyncio.gather(outcome(early), outcome(late))
+    failures += not check(
+        "caller timeout leaves shared call running",
+        early_result == "TimeoutError" and late_result == "result" and len(calls) == 1,
+    )
+    return failures
+
+
+async def check_queue_overflow() -> int:
+    print("queue overflow")
+    admission = AdmissionController(max_concurrency=1, max_queue=1)
+    deadline = admission.deadline_after(1)
+
+    active = asyncio.ensure_future(hold(admission, deadline, 0.05))
+    await asyncio.sleep(0)
+    queued = asyncio.ensure_future(hold(admission, deadline, 0.01))
+    await asyncio.sleep(0)
+    overflow = await outcome(hold(admission, deadline, 0.01))
+
+    failures = 0
+    failures += not check("request beyond the queue is shed", overflow == "AdmissionRejected")
+    failures += not check(
+        "active and queued requests are served",
+        await asyncio.gather(active, queued) == ["served", "served"],
+    )
+    return failures
+
+
+async def check_expiry_in_queue() -> int:
+    print("expiry in queue")
+    admission = AdmissionController(max_concurrency=1, max_queue=4)
+
+    active = asyncio.ensure_future(hold(admission, admission.deadline_after(1), 0.2))
+    await asyncio.sleep(0)
+    expired = await outcome(hold(admission, admission.deadline_after(0.05), 0.01))
+
+    failures = 0
+    failures += not check("queued past its deadline is rejected", expired == "AdmissionRejected")
+    failures += not check("slot holder unaffected", await active == "served")
+    failures += not check("slot released", not admission._semaphore.locked())
+    return failures
+
+
+async def check_early_reject() -> int:
+    print("early reject")
+    admission = AdmissionController(max_concurrency=1, max_queue=4)
+    admission.service_time = 0.2
+
+    active = asyncio.ensure_future(hold(admission, admission.deadline_after(1), 0.05))
+    await asyncio.sleep(0)
+    rejected = await outcome(hold(admission, admission.deadline_after(0.1), 0.01))
+    await active
+
+    failures = 0
+    failures += not check(
+        "deadline shorter than the service time is rejected up front",
+        rejected == "AdmissionRejected",
+    )
+    return failures
+
+
+async def check_shared_deadlines() -> int:
+    print("shared call, different deadlines")
+    single_flight = SingleFlight()
+    admission = AdmissionController(max_concurrency=1, max_queue=4)
+    calls = []
+    lookup = admitted_lookup(admission, calls)
+
+    async def query(timeout: float):
+        deadline = admission.deadline_after(timeout)
+        return await asyncio.wait_for(
+            single_flight.do("k", lookup, deadline), admission.remaining(deadline)
+        )
+
+    busy = asyncio.ensure_future(hold(admission, admission.deadline_after(1), 0.2))
+    await asyncio.sleep(0)
+
+    leader, *followers = await asyncio.gather(
+        outcome(query(0.1)), outcome(query(3)), outcome(query(3))
+    )
+    await busy
+
+    failures = 0
+    failures += not check("tight-deadline leader times out", leader == "TimeoutError")
+    failures += not check("followers still served", followers == ["result", "result"])
+    failures += not check("one lookup for all three", len(calls) == 1)
+    return failures
+
+
+async def check_abandoned_calls() -> int:
+    print("abandoned calls")
+    single_flight = SingleFlight()
+    admission = AdmissionController(max_concurrency=1, max_queue=16)
+    calls = []
+    lookup = admitted_lookup(admission, calls)
+
+    async def query(key: str, timeout: float):
+        deadline = admission.deadline_after(timeout)
+        return await asyncio.wait_for(
+            single_flight.do(key, lookup, deadline), admission.remaining(deadline)
+        )
+
+    busy = asyncio.ensure_future(hold(admission, admission.deadline_after(1), 0.2))
+    await asyncio.sleep(0)
+
+    results = await asyncio.gather(*(outcome(query(f"k{i}", 0.05)) for i in range(6)))
+    await asyncio.sleep(0)
+
+    failures = 0
+    failures += not check("every caller times out", results == ["TimeoutError"] * 6)
+    failures += not check("abandoned calls leave the queue", admission._waiting == 0)
+    failures += not check("no key left in flight", len(single_flight) == 0)
+
+    await busy
+    await asyncio.sleep(0.1)
+    failures += not check("abandoned lookups never run", calls == [])
+    return failures
+
+
+async def run_tests() -> int:
+    failures = 0
+    for test in (
+        check_sharing,
+        check_queue_overflow,
+        check_expiry_in_queue,
+        check_early_reject,
+        check_shared_deadlines,
+        check_abandoned_calls,
+    ):
+        failures += await test()
+
+    print(f"\n{'✅ All checks passed' if not failures else f'❌ {failures} failed'}")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if asyncio.run(run_tests()) else 0)
@@ -0,0 +1,65 @@
+"""
+settings.py
+
+Runtime settings, read from environment variables.
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+
+load_dotenv()  # loads .env from project root
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# -----------------------------
+# API
+# -----------------------------
+
+# Serve /query by splicing pre-rendered result JSON instead of
+# building and validating a response model per request.
+PRERENDERED_RESPONSES = _env_flag("PRERENDERED_RESPONSES")
+
+# Return the best-scoring matches (server-side top-k) instead of
+# the first ones the database happens to find.
+RANKED_RESULTS = _env_flag("RANKED_RESULTS")
+
+# Admission control for /query: lookups running at once, lookups
+# allowed to wait for a slot, and the default per-request deadline.
+QUERY_MAX_CONCURRENCY = int(os.getenv("QUERY_MAX_CONCURRENCY", "16"))
+QUERY_MAX_QUEUE = int(os.getenv("QUERY_MAX_QUEUE", "64"))
+QUERY_DEADLINE_MS = int(os.getenv("QUERY_DEADLINE_MS", "3000"))
+
+
+# -----------------------------
+# Diagnostics
+# -----------------------------
+
+# /query calls at least this slow are logged with an explain() summary.
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500"))
+SLOW_QUERY_LOG_PATH = os.getenv("SLOW_QUERY_LOG_PATH", "slow_queries.jsonl")
+# A lookup is explained at most once per this many seconds.
+SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS = float(
+    os.getenv("SLOW_QUERY_EXPLAIN_COOLDOWN_SECONDS", "60")
+)
+
+# Exposes /debug/slow-queries and /debug/profile. Keep off in public deployments.
+DEBUG_ENDPOINTS = _env_flag("DEBUG_ENDPOINTS")
+
+
+# -----------------------------
+# Intent Parsing
+# -----------------------------
+
+# How long an API process keeps the locality vocabulary before
+# reloading it (picks up a re-seed without a restart).
+LOCALITY_VOCABULARY_TTL_SECONDS = int(
+    os.getenv("LOCALITY_VOCABULARY_TTL_SECONDS", "300")
+)
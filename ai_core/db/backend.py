@@ -0,0 +1,137 @@
+"""
+backend.py
+
+Storage backend interface behind property_tool.
+
+A backend stores property documents (see mongo/schemas.py) and answers
+the MongoDB-style query dicts produced by property_tool.build_query.
+
+Backends:
+- "mongo":  MongoDB (mongo/backend.py), the default
+- "sqlite": embedded SQLite file (sqlite/backend.py), for single-box
+            and kiosk deployments with no database server
+
+Selected with the STORAGE_BACKEND environment variable.
+"""
+
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional
+
+from dotenv import load_dotenv
+
+
+load_dotenv()
+
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "mongo")
+
+
+# -----------------------------
+# Relevance Ranking
+# -----------------------------
+
+# Shared by every backend so ranked results agree across them
+RANKING_WEIGHTS = {
+    "price": 0.5,
+    "tags": 0.3,
+    "recency": 0.2,
+}
+RANKING_TAGS = ["PARK", "CORNER"]
+RECENCY_HALF_LIFE_DAYS = 180
+
+
+# -----------------------------
+# Interface
+# -----------------------------
+
+class StorageBackend(ABC):
+    """
+    Documents returned by find() look like stored property documents
+    (with "_id"), or {"_id", "rendered": {"result_json"}} when
+    rendered=True.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def find(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        rank: bool = False,
+        target_price: Optional[float] = None,
+        rendered: bool = False,
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        First `limit` matches, or the `limit` best-scoring ones if rank.
+        """
+
+    @abstractmethod
+    def find_by_ids(self, ids: List[Any]) -> Iterable[Dict[str, Any]]:
+        """
+        Full documents for the given ids, in any order.
+        """
+
+    @abstractmethod
+    def explain(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        rank: bool = False,
+        target_price: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Plan summary: keys_examined, docs_examined, returned,
+        execution_ms, plan (None where the backend can't tell).
+        """
+
+    @abstractmethod
+    def insert_many(self, documents: List[Dict[str, Any]]) -> int:
+        """
+        Stores documents, returns how many were inserted.
+        """
+
+    @abstractmethod
+    def distinct(self, path: str) -> List[Any]:
+        """
+        Distinct values of a dotted document path, e.g. "location.sector".
+        """
+
+    @abstractmethod
+    def ensure_indexes(self) -> None:
+        ...
+
+    @abstractmethod
+    def save_vocabulary(self, vocabulary: Dict[str, List[str]]) -> None:
+        ...
+
+    @abstractmethod
+    def load_vocabulary(self) -> Dict[str, List[str]] | None:
+        ...
+
+
+# -----------------------------
+# Backend Selection
+# -----------------------------
+
+_backends: Dict[str, StorageBackend] = {}
+
+
+def get_backend(name: Optional[str] = None) -> StorageBackend:
+    """
+    Returns the (shared) backend instance for `name`,
+    defaulting to STORAGE_BACKEND.
+    """
+    name = (name or STORAGE_BACKEND).lower()
+
+    if name not in _backends:
+        if name == "mongo":
+            from .mongo.backend import MongoBackend
+            _backends[name] = MongoBackend()
+        elif name == "sqlite":
+            from .sqlite.backend import SQLiteBackend
+            _backends[name] = SQLiteBackend()
+        else:
+            raise ValueError(f"Unknown storage backend: {name}")
+
+    return _backends[name]
@@ -0,0 +1,101 @@
+"""
+archive.py
+
+Moves stale listings out of the hot properties collection.
+
+Listings whose meta.listing_date is older than the horizon are copied
+to the archive collection, then deleted from properties, so the hot
+collection and its indexes only hold current listings.
+Listings without a known date stay in place.
+
+MongoDB only: the embedded backend is meant for small, single-box
+datasets.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+from pymongo.errors import BulkWriteError
+
+from db.mongo.backend import MongoBackend
+from db.mongo.client import get_db, get_properties_collection
+from db.mongo.schemas import months_before
+from db.vocabulary import refresh_vocabulary
+
+
+# -----------------------------
+# Configuration
+# -----------------------------
+
+ARCHIVE_COLLECTION = "properties_archive"
+
+ARCHIVE_HORIZON_MONTHS = int(os.getenv("ARCHIVE_HORIZON_MONTHS", "36"))
+
+BATCH_SIZE = 500
+
+DUPLICATE_KEY = 11000
+
+
+# -----------------------------
+# Archiver
+# -----------------------------
+
+def archive_stale_listings(
+    collection,
+    archive,
+    horizon_months: int,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """
+    Moves listings older than `horizon_months` into `archive`.
+    Returns the number of listings moved.
+
+    Copy-then-delete per batch: an interrupted run leaves at worst a
+    few listings in both collections, and re-running finishes the move.
+    """
+    cutoff = months_before(datetime.utcnow(), horizon_months)
+    query = {"meta.listing_date": {"$lt": cutoff}}
+
+    moved = 0
+
+    while True:
+        batch = list(collection.find(query).limit(batch_size))
+        if not batch:
+            break
+
+        try:
+            archive.insert_many(batch, ordered=False)
+        except BulkWriteError as exc:
+            # Already archived by an earlier, interrupted run
+            errors = exc.details.get("writeErrors", [])
+            if any(e.get("code") != DUPLICATE_KEY for e in errors):
+                raise
+
+        ids = [doc["_id"] for doc in batch]
+        moved += collection.delete_many({"_id": {"$in": ids}}).deleted_count
+
+    return moved
+
+
+def run_archive(horizon_months: int = ARCHIVE_HORIZON_MONTHS):
+    db = get_db()
+    collection = get_properties_collection()
+
+    cutoff = months_before(datetime.utcnow(), horizon_months)
+    print(f"🗄️ Archiving listings older than {cutoff.date()} ({horizon_months} months)")
+
+    moved = archive_stale_listings(collection, db[ARCHIVE_COLLECTION], horizon_months)
+
+    # Archived localities should no longer be suggested
+    refresh_vocabulary(MongoBackend(collection=collection, db=db))
+
+    print(f"✔ Archived: {moved}")
+    print(f"✔ Remaining: {collection.estimated_document_count()}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_archive(int(sys.argv[1]))
+    else:
+        run_archive()
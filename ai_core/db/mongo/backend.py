@@ -0,0 +1,238 @@
+"""
+backend.py
+
+MongoDB storage backend.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from pymongo.errors import BulkWriteError
+
+from ..backend import (
+    RANKING_TAGS,
+    RANKING_WEIGHTS,
+    RECENCY_HALF_LIFE_DAYS,
+    StorageBackend,
+)
+from .client import get_db, get_properties_collection
+from .indexes import ensure_indexes
+
+
+RENDERED_PROJECTION = {"_id": 1, "rendered.result_json": 1}
+
+MS_PER_DAY = 24 * 60 * 60 * 1000
+
+VOCABULARY_COLLECTION = "locality_vocabulary"
+VOCABULARY_ID = "locality"
+
+
+# -----------------------------
+# Relevance Ranking
+# -----------------------------
+
+def build_score_expression(target_price: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Aggregation expression scoring a property between 0 and 1:
+    closeness to the target price, PARK / CORNER tags, listing recency.
+    Missing fields score 0 for their component.
+    """
+
+    components = []
+
+    if target_price:
+        components.append({"$multiply": [RANKING_WEIGHTS["price"], {
+            "$cond": [
+                {"$isNumber": "$pricing.asking_crore"},
+                {"$subtract": [1, {"$min": [1, {"$divide": [
+                    {"$abs": {"$subtract": ["$pricing.asking_crore", target_price]}},
+                    target_price,
+                ]}]}]},
+                0,
+            ]
+        }]})
+
+    components.append({"$multiply": [RANKING_WEIGHTS["tags"], {"$divide": [
+        {"$size": {"$setIntersection": [
+            {"$ifNull": ["$status.tags", []]},
+            RANKING_TAGS,
+        ]}},
+        len(RANKING_TAGS),
+    ]}]})
+
+    # exp(-ln2 * age / half_life): 1 today, 0.5 after one half-life
+    age_days = {"$divide": [
+        {"$subtract": [
+            "$$NOW",
+            {"$ifNull": ["$meta.listing_date", "$meta.entry_date"]},
+        ]},
+        MS_PER_DAY,
+    ]}
+    components.append({"$multiply": [RANKING_WEIGHTS["recency"], {"$ifNull": [
+        {"$exp": {"$multiply": [-0.693147 / RECENCY_HALF_LIFE_DAYS, age_days]}},
+        0,
+    ]}]})
+
+    return {"$add": components}
+
+
+def build_ranking_pipeline(
+    query: Dict[str, Any],
+    limit: int,
+    target_price: Optional[float] = None,
+    projection: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Aggregation pipeline for ranked search.
+    $sort directly followed by $limit is coalesced by the server into a
+    top-k sort, so only `limit` documents are kept and returned.
+    """
+
+    pipeline: List[Dict[str, Any]] = [
+        {"$match": query},
+        {"$addFields": {"_score": build_score_expression(target_price)}},
+        {"$sort": {"_score": -1, "_id": 1}},
+        {"$limit": limit},
+    ]
+
+    if projection:
+        pipeline.append({"$project": projection})
+
+    return pipeline
+
+
+# -----------------------------
+# Explain
+# -----------------------------
+
+def _plan_stages(plan: Dict[str, Any]) -> List[str]:
+    """
+    Flattens a winning plan into ['LIMIT', 'FETCH', 'IXSCAN location.city_1_...'].
+    """
+    stages = []
+    while plan:
+        stage = plan.get("stage", "?")
+        if plan.get("indexName"):
+            stage = f"{stage} {plan['indexName']}"
+        stages.append(stage)
+        plan = plan.get("inputStage") or (plan.get("inputStages") or [None])[0]
+    return stages
+
+
+def summarize_explain(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keeps the parts of an explain("executionStats") worth logging.
+    """
+    # Aggregations nest the find part under the first $cursor stage
+    for stage in explain.get("stages", []):
+        if "$cursor" in stage:
+            explain = stage["$cursor"]
+            break
+
+    stats = explain.get("executionStats", {})
+    winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+
+    return {
+        "keys_examined": stats.get("totalKeysExamined"),
+        "docs_examined": stats.get("totalDocsExamined"),
+        "returned": stats.get("nReturned"),
+        "execution_ms": stats.get("executionTimeMillis"),
+        "plan": _plan_stages(winning_plan.get("queryPlan", winning_plan)),
+    }
+
+
+# -----------------------------
+# Backend
+# -----------------------------
+
+class MongoBackend(StorageBackend):
+
+    name = "mongo"
+
+    def __init__(self, collection=None, db=None):
+        self._collection = collection
+        self._db = db
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            self._collection = get_properties_collection()
+        return self._collection
+
+    @property
+    def db(self):
+        if self._db is None:
+            self._db = get_db()
+        return self._db
+
+    def find(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        rank: bool = False,
+        target_price: Optional[float] = None,
+        rendered: bool = False,
+    ) -> Iterable[Dict[str, Any]]:
+        projection = RENDERED_PROJECTION if rendered else None
+
+        if rank:
+            return self.collection.aggregate(
+                build_ranking_pipeline(query, limit, target_price, projection)
+            )
+
+        return (
+            self.collection
+            .find(query, projection)
+            .limit(limit)
+        )
+
+    def find_by_ids(self, ids: List[Any]) -> Iterable[Dict[str, Any]]:
+        return self.collection.find({"_id": {"$in": ids}})
+
+    def explain(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        rank: bool = False,
+        target_price: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        if rank:
+            command = {
+                "aggregate": self.collection.name,
+                "pipeline": build_ranking_pipeline(query, limit, target_price),
+                "cursor": {},
+            }
+        else:
+            command = {"find": self.collection.name, "filter": query, "limit": limit}
+
+        explain = self.collection.database.command(
+            "explain", command, verbosity="executionStats"
+        )
+        return summarize_explain(explain)
+
+    def insert_many(self, documents: List[Dict[str, Any]]) -> int:
+        try:
+            result = self.collection.insert_many(documents, ordered=False)
+            return len(result.inserted_ids)
+        except BulkWriteError as exc:
+            print("⚠️ Bulk write warning:", exc.details.get("writeErrors"))
+            return exc.details.get("nInserted", 0)
+
+    def distinct(self, path: str) -> List[Any]:
+        return self.collection.distinct(path)
+
+    def ensure_indexes(self) -> None:
+        ensure_indexes(self.collection)
+
+    def save_vocabulary(self, vocabulary: Dict[str, List[str]]) -> None:
+        self.db[VOCABULARY_COLLECTION].replace_one(
+            {"_id": VOCABULARY_ID},
+            {"terms": vocabulary, "built_at": datetime.utcnow()},
+            upsert=True,
+        )
+
+    def load_vocabulary(self) -> Dict[str, List[str]] | None:
+        doc = self.db[VOCABULARY_COLLECTION].find_one({"_id": VOCABULARY_ID})
+        if not doc:
+            return None
+        return doc.get("terms")
@@ -21,12 +21,6 @@ load_dotenv()  # loads .env from project root
 MONGO_URI = os.getenv("MONGO_URI")
 DB_NAME = os.getenv("MONGO_DB_NAME", "property_ai")
 
-if not MONGO_URI:
-    raise RuntimeError(
-        "MONGO_URI not found. Check your .env file. "
-        "Do NOT hardcode MongoDB credentials."
-    )
-
 # -----------------------------
 # Client Initialization
 # -----------------------------
@@ -39,6 +33,14 @@ def get_client() -> MongoClient:
     global _client
 
     if _client is None:
+        # Checked here, not at import: embedded-backend deployments
+        # import this module without ever connecting.
+        if not MONGO_URI:
+            raise RuntimeError(
+                "MONGO_URI not found. Check your .env file. "
+                "Do NOT hardcode MongoDB credentials."
+            )
+
         _client = MongoClient(
             MONGO_URI,
             serverSelectionTimeoutMS=5000
@@ -0,0 +1,46 @@
+"""
+indexes.py
+
+Index definitions for the properties collection.
+Safe to run repeatedly (create_index is idempotent).
+"""
+
+from pymongo import ASCENDING, DESCENDING
+
+
+# -----------------------------
+# Index Definitions
+# -----------------------------
+
+PROPERTY_INDEXES = [
+    # Locality lookups: "sector 16 block D pocket 3"
+    [
+        ("location.sector", ASCENDING),
+        ("location.block", ASCENDING),
+        ("location.pocket", ASCENDING),
+    ],
+    # City-wide lookups, narrowed by sector when given
+    [
+        ("location.city", ASCENDING),
+        ("location.sector", ASCENDING),
+    ],
+    # "listed in the last N months", recency ranking and archiving
+    [
+        ("meta.listing_date", DESCENDING),
+    ],
+    [
+        ("location.city", ASCENDING),
+        ("meta.listing_date", DESCENDING),
+    ],
+    # Full-text search: multikey index, prefix lookups are range scans
+    [
+        ("search.terms", ASCENDING),
+    ],
+]
+
+
+def ensure_indexes(collection) -> list[str]:
+    """
+    Creates all property indexes. Returns the index names.
+    """
+    return [collection.create_index(keys) for keys in PROPERTY_INDEXES]
@@ -6,9 +6,18 @@ Defines:
 - Normalization helpers for messy CSV data
 """
 
+from calendar import monthrange
 from datetime import datetime
+import json
 import re
 
+from bson import ObjectId
+
+try:
+    import orjson
+except ImportError:  # optional speedup, falls back to stdlib json
+    orjson = None
+
 
 # -----------------------------
 # Normalization Helpers
@@ -98,6 +107,60 @@ def normalize_tags(*values) -> list[str]:
     return list(tags)
 
 
+def normalize_locality(value) -> str | None:
+    """
+    Normalizes sector / block / pocket values into uppercase strings.
+    Example: 16.0 -> '16', ' d ' -> 'D'
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return None
+        if value.is_integer():
+            value = int(value)
+
+    value_str = str(value).strip().upper()
+    return value_str or None
+
+
+LISTING_DATE_FORMATS = ["%d-%b-%Y", "%d-%b-%y", "%Y-%m-%d", "%d/%m/%Y"]
+
+
+def parse_listing_date(value) -> datetime | None:
+    """
+    Parses the CSV DATE column.
+    Example: '3-Feb-2015' -> datetime(2015, 2, 3)
+    """
+    if value is None:
+        return None
+
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+
+    text = str(value).strip()
+    for fmt in LISTING_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+
+    return None
+
+
+def months_before(when: datetime, months: int) -> datetime:
+    """
+    Same day-of-month, `months` calendar months earlier
+    (clamped to the month's last day).
+    """
+    total = when.year * 12 + (when.month - 1) - months
+    year, month = divmod(total, 12)
+    month += 1
+    day = min(when.day, monthrange(year, month)[1])
+    return when.replace(year=year, month=month, day=day)
+
+
 def normalize_contact_role(through: str | None) -> str:
     """
     Determines contact role based on THROUGH column.
@@ -112,6 +175,49 @@ def normalize_contact_role(through: str | None) -> str:
     return value
 
 
+# -----------------------------
+# Search Terms
+# -----------------------------
+
+SEARCH_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Words that would match almost everything, dropped at index and query time
+SEARCH_STOPWORDS = {
+    "a", "an", "and", "at", "by", "for", "from", "in", "of", "on", "or",
+    "the", "that", "this", "to", "with",
+    "listing", "listings", "property", "properties",
+}
+
+
+def tokenize_search_text(*values) -> list[str]:
+    """
+    Lowercase word tokens for full-text search, deduplicated, in order.
+    Example: ('MAP PASS', 'Manu Sharma') -> ['map', 'pass', 'manu', 'sharma']
+    """
+    tokens: dict[str, None] = {}
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        for token in SEARCH_TOKEN_PATTERN.findall(value.lower()):
+            if len(token) > 1 and token not in SEARCH_STOPWORDS:
+                tokens[token] = None
+    return list(tokens)
+
+
+def build_search_terms(document: dict) -> list[str]:
+    """
+    Terms indexed for full-text search: remarks, contact and office
+    names, the channel (THROUGH, e.g. 'VISITED') and raw status tags.
+    """
+    return tokenize_search_text(
+        document["deal"].get("remarks"),
+        document["deal"].get("channel"),
+        document["contact"].get("name"),
+        document["contact"].get("office_name"),
+        *document["status"].get("tags", []),
+    )
+
+
 # -----------------------------
 # Property Document Builder
 # -----------------------------
@@ -126,14 +232,17 @@ def build_property_document(row: dict) -> dict:
     document = {
         "meta": {
             "entry_date": datetime.utcnow(),
+            "listing_date": parse_listing_date(row.get("DATE")),
             "source": "csv_import"
         },
 
         "location": {
             "city": row.get("CITY"),
-            "sector": row.get("SEC") or row.get("SEC.1"),
-            "block": row.get("BLOCK") or row.get("BLK"),
-            "pocket": row.get("POCKET") or row.get("PKT"),
+            "sector": normalize_locality(
+                row.get("SECTOR") or row.get("SEC") or row.get("SEC.1")
+            ),
+            "block": normalize_locality(row.get("BLOCK") or row.get("BLK")),
+            "pocket": normalize_locality(row.get("POCKET") or row.get("PKT")),
             "house_number": row.get("NUMBER") or row.get("NUM"),
             "road": row.get("ROAD"),
             "facing": row.get("FACE")
@@ -183,4 +292,75 @@ def build_property_document(row: dict) -> dict:
         "raw_csv": row
     }
 
+    document["search"] = {
+        "terms": build_search_terms(document)
+    }
+
+    return document
+
+
+# -----------------------------
+# Pre-rendered Result Payload
+# -----------------------------
+
+def dumps_json(value) -> bytes:
+    """
+    Serializes a value to compact JSON bytes.
+    Uses orjson when installed, stdlib json otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+
+    return json.dumps(
+        value, default=str, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def build_result_summary(doc: dict) -> dict:
+    """
+    Builds the AI-friendly view of a stored property document.
+    This is the shape returned by search_properties.
+    """
+    listing_date = doc.get("meta", {}).get("listing_date")
+
+    return {
+        "id": str(doc["_id"]),
+        "city": doc["location"].get("city"),
+        "sector": doc["location"].get("sector"),
+        "block": doc["location"].get("block"),
+        "pocket": doc["location"].get("pocket"),
+        "house_number": doc["location"].get("house_number"),
+
+        "bhk": doc["property"].get("bhk_normalized"),
+        "area_category": doc["property"].get("area_category"),
+        "floors": doc["property"].get("floors"),
+
+        "asking_price_crore": doc["pricing"].get("asking_crore"),
+
+        "contact_name": doc["contact"].get("name"),
+        "contact_role": doc["contact"].get("role"),
+        "contact_mobile": doc["contact"].get("primary_mobile"),
+
+        "tags": doc["status"].get("tags", []),
+
+        "listing_date": listing_date.date().isoformat() if listing_date else None,
+    }
+
+
+def render_result_json(doc: dict) -> bytes:
+    """
+    Renders the AI-friendly result of a document as JSON bytes.
+    """
+    return dumps_json(build_result_summary(doc))
+
+
+def attach_rendered_result(document: dict) -> dict:
+    """
+    Stores the pre-rendered result JSON on a document before insert.
+    Assigns the _id up front so the rendered payload can carry it.
+    """
+    document.setdefault("_id", ObjectId())
+    document["rendered"] = {
+        "result_json": render_result_json(document)
+    }
     return document
@@ -1,18 +1,30 @@
 """
 seed.py
 
-Seeds MongoDB with property data from CSV.
+Seeds the property store with data from CSV.
 Uses schemas.py for normalization.
+
+Targets STORAGE_BACKEND (MongoDB by default);
+pass --backend sqlite to build the embedded database instead.
 """
 
 import sys
 from pathlib import Path
+from typing import Callable
 
 import pandas as pd
-from pymongo.errors import BulkWriteError
+from pymongo import UpdateOne
 
+from db.backend import get_backend
 from db.mongo.client import get_properties_collection
-from db.mongo.schemas import build_property_document
+from db.mongo.schemas import (
+    attach_rendered_result,
+    build_property_document,
+    build_search_terms,
+    parse_listing_date,
+    render_result_json,
+)
+from db.vocabulary import refresh_vocabulary
 
 
 # -----------------------------
@@ -48,7 +60,7 @@ def clean_row(row: dict) -> dict:
 # Main Seeder
 # -----------------------------
 
-def run_seed():
+def run_seed(backend_name: str | None = None):
     if not CSV_PATH.exists():
         print(f"❌ CSV file not found: {CSV_PATH}")
         sys.exit(1)
@@ -58,7 +70,8 @@ def run_seed():
 
     print(f"📊 Total rows found: {len(df)}")
 
-    collection = get_properties_collection()
+    backend = get_backend(backend_name)
+    print(f"🗃️ Target backend: {backend.name}")
 
     documents = []
     inserted = 0
@@ -68,11 +81,11 @@ def run_seed():
         try:
             raw_row = clean_row(row.to_dict())
             doc = build_property_document(raw_row)
+            attach_rendered_result(doc)
             documents.append(doc)
 
             if len(documents) >= BATCH_SIZE:
-                result = collection.insert_many(documents, ordered=False)
-                inserted += len(result.inserted_ids)
+                inserted += backend.insert_many(documents)
                 documents.clear()
 
         except Exception as exc:
@@ -81,16 +94,99 @@ def run_seed():
 
     # Insert remaining docs
     if documents:
-        try:
-            result = collection.insert_many(documents, ordered=False)
-            inserted += len(result.inserted_ids)
-        except BulkWriteError as exc:
-            print("⚠️ Bulk write warning:", exc.details)
+        inserted += backend.insert_many(documents)
+
+    backend.ensure_indexes()
+
+    # API processes pick this up on their next vocabulary reload
+    vocabulary = refresh_vocabulary(backend)
 
     print("✅ Seeding complete")
     print(f"✔ Inserted: {inserted}")
     print(f"⚠ Skipped: {skipped}")
+    print(f"📚 Locality terms: {sum(len(v) for v in vocabulary.values())}")
+
+
+def _backfill(field: str, compute: Callable[[dict], dict]) -> int:
+    """
+    Sets compute(doc) (a $set document) on every document missing
+    `field`, in batches. Returns the number of documents updated.
+    """
+    collection = get_properties_collection()
+
+    cursor = collection.find({field: {"$exists": False}})
+
+    updates = []
+    updated = 0
+
+    for doc in cursor:
+        updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": compute(doc)}))
+
+        if len(updates) >= BATCH_SIZE:
+            updated += collection.bulk_write(updates, ordered=False).modified_count
+            updates.clear()
+
+    if updates:
+        updated += collection.bulk_write(updates, ordered=False).modified_count
+
+    return updated
+
+
+def backfill_rendered_results():
+    """
+    Pre-renders result JSON for documents missing it
+    (seeded before pre-rendering, or $unset after an update).
+    MongoDB only: the embedded backend renders on insert.
+    """
+    rendered = _backfill(
+        "rendered.result_json",
+        lambda doc: {"rendered.result_json": render_result_json(doc)},
+    )
+    print(f"✔ Rendered: {rendered}")
+
+
+def _with_listing_date(doc: dict) -> dict:
+    doc.setdefault("meta", {})["listing_date"] = parse_listing_date(
+        doc.get("raw_csv", {}).get("DATE")
+    )
+    # Fragments rendered before listing dates existed lack the field
+    return {
+        "meta.listing_date": doc["meta"]["listing_date"],
+        "rendered.result_json": render_result_json(doc),
+    }
+
+
+def backfill_listing_dates():
+    """
+    Sets meta.listing_date from the raw CSV DATE on documents seeded
+    before it existed, and re-renders their result JSON to match.
+    Documents without a usable DATE get None, as on a fresh seed.
+    MongoDB only: the embedded backend is rebuilt by re-seeding.
+    """
+    dated = _backfill("meta.listing_date", _with_listing_date)
+    print(f"✔ Listing dates set: {dated}")
+
+
+def backfill_search_terms():
+    """
+    Adds full-text search terms to documents seeded before they existed.
+    MongoDB only: the embedded backend is rebuilt by re-seeding.
+    """
+    indexed = _backfill(
+        "search.terms",
+        lambda doc: {"search.terms": build_search_terms(doc)},
+    )
+    print(f"✔ Indexed for search: {indexed}")
 
 
 if __name__ == "__main__":
-    run_seed()
+    if "--backfill-rendered" in sys.argv:
+        backfill_rendered_results()
+    elif "--backfill-listing-dates" in sys.argv:
+        backfill_listing_dates()
+    elif "--backfill-search-terms" in sys.argv:
+        backfill_search_terms()
+    elif "--backend" in sys.argv:
+        run_seed(sys.argv[sys.argv.index("--backend") + 1])
+    else:
+        run_seed()
@@ -0,0 +1,489 @@
+"""
+backend.py
+
+Embedded SQLite storage backend.
+
+Serves property queries in-process from a single file, no database
+server or network hop: single-box deployments and edge kiosks.
+
+Searchable fields live in typed, indexed columns; array fields
+(floors, tags, full-text search terms) in child tables. The full document is kept as JSON
+next to its pre-rendered search result.
+
+MongoDB-style query dicts from build_query are translated to SQL
+by translate_query().
+"""
+
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..backend import (
+    RANKING_TAGS,
+    RANKING_WEIGHTS,
+    RECENCY_HALF_LIFE_DAYS,
+    StorageBackend,
+)
+from ..mongo.schemas import attach_rendered_result, dumps_json
+
+
+SQLITE_PATH = os.getenv("SQLITE_PATH", "property_ai.sqlite3")
+
+
+# -----------------------------
+# Schema
+# -----------------------------
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS properties (
+    id            TEXT PRIMARY KEY,
+    city          TEXT,
+    sector        TEXT,
+    block         TEXT,
+    pocket        TEXT,
+    bhk           INTEGER,
+    area_category TEXT,
+    asking_crore  REAL,
+    net_crore     REAL,
+    contact_role  TEXT,
+    listing_date  TEXT,  -- ISO 8601, sorts chronologically
+    entry_date    TEXT,
+    document      TEXT NOT NULL,
+    result_json   BLOB
+);
+
+CREATE TABLE IF NOT EXISTS property_floors (
+    property_id TEXT NOT NULL REFERENCES properties(id) ON DELETE CASCADE,
+    floor       TEXT NOT NULL,
+    PRIMARY KEY (property_id, floor)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS property_tags (
+    property_id TEXT NOT NULL REFERENCES properties(id) ON DELETE CASCADE,
+    tag         TEXT NOT NULL,
+    PRIMARY KEY (property_id, tag)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS property_terms (
+    property_id TEXT NOT NULL REFERENCES properties(id) ON DELETE CASCADE,
+    term        TEXT NOT NULL,
+    PRIMARY KEY (property_id, term)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS metadata (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_properties_locality
+    ON properties (sector, block, pocket);
+CREATE INDEX IF NOT EXISTS idx_properties_city
+    ON properties (city, sector);
+CREATE INDEX IF NOT EXISTS idx_properties_city_listing
+    ON properties (city, listing_date);
+CREATE INDEX IF NOT EXISTS idx_properties_listing
+    ON properties (listing_date);
+CREATE INDEX IF NOT EXISTS idx_properties_bhk_price
+    ON properties (bhk, asking_crore);
+CREATE INDEX IF NOT EXISTS idx_property_floors_floor
+    ON property_floors (floor, property_id);
+CREATE INDEX IF NOT EXISTS idx_property_tags_tag
+    ON property_tags (tag, property_id);
+CREATE INDEX IF NOT EXISTS idx_property_terms_term
+    ON property_terms (term, property_id);
+"""
+
+VOCABULARY_KEY = "locality_vocabulary"
+
+# Document path -> properties column
+FIELD_COLUMNS = {
+    "_id": "id",
+    "location.city": "city",
+    "location.sector": "sector",
+    "location.block": "block",
+    "location.pocket": "pocket",
+    "property.bhk_normalized": "bhk",
+    "property.area_category": "area_category",
+    "pricing.asking_crore": "asking_crore",
+    "pricing.net_crore": "net_crore",
+    "contact.role": "contact_role",
+    "meta.listing_date": "listing_date",
+    "meta.entry_date": "entry_date",
+}
+
+# Array document path -> (child table, value column)
+ARRAY_TABLES = {
+    "property.floors": ("property_floors", "floor"),
+    "status.tags": ("property_tags", "tag"),
+    "search.terms": ("property_terms", "term"),
+}
+
+COMPARISONS = {
+    "$eq": "=",
+    "$gt": ">",
+    "$gte": ">=",
+    "$lt": "<",
+    "$lte": "<=",
+}
+
+
+# -----------------------------
+# Query Translation
+# -----------------------------
+
+def _sql_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if value is not None and not isinstance(value, (str, int, float)):
+        return str(value)  # ObjectId
+    return value
+
+
+def _placeholders(count: int) -> str:
+    return ", ".join("?" * count)
+
+
+def _prefix_bounds(pattern: re.Pattern) -> Tuple[str, str]:
+    """
+    Anchored prefix regex -> [low, high) range, e.g. ^shar -> ('shar', 'shas').
+    A range keeps the lookup on the index, unlike LIKE or a regex function.
+    """
+    match = re.fullmatch(r"\^([a-z0-9]+)", pattern.pattern)
+    if not match:
+        raise ValueError(f"Unsupported regex for SQL: {pattern.pattern}")
+
+    prefix = match.group(1)
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _column_clause(column: str, condition: Any, params: List[Any]) -> List[str]:
+    if not isinstance(condition, dict):
+        params.append(_sql_value(condition))
+        return [f"p.{column} = ?"]
+
+    clauses = []
+    for op, value in condition.items():
+        if op in COMPARISONS:
+            clauses.append(f"p.{column} {COMPARISONS[op]} ?")
+            params.append(_sql_value(value))
+        elif op == "$in":
+            clauses.append(f"p.{column} IN ({_placeholders(len(value))})")
+            params.extend(_sql_value(v) for v in value)
+        else:
+            raise ValueError(f"Unsupported operator for SQL: {op}")
+
+    return clauses
+
+
+def _array_clause(table: str, column: str, condition: Any, params: List[Any]) -> List[str]:
+    exists = (
+        f"EXISTS (SELECT 1 FROM {table} a "
+        f"WHERE a.property_id = p.id AND a.{column} {{}})"
+    )
+
+    if not isinstance(condition, dict):
+        params.append(_sql_value(condition))
+        return [exists.format("= ?")]
+
+    clauses = []
+    for op, values in condition.items():
+        if op == "$all":
+            # One EXISTS per value: the array must contain all of them
+            for value in values:
+                if isinstance(value, re.Pattern):
+                    # IN over the value index lets it drive the lookup
+                    clauses.append(
+                        f"p.id IN (SELECT property_id FROM {table} "
+                        f"WHERE {column} >= ? AND {column} < ?)"
+                    )
+                    params.extend(_prefix_bounds(value))
+                else:
+                    clauses.append(exists.format("= ?"))
+                    params.append(_sql_value(value))
+        elif op == "$in":
+            clauses.append(exists.format(f"IN ({_placeholders(len(values))})"))
+            params.extend(_sql_value(v) for v in values)
+        else:
+            raise ValueError(f"Unsupported operator for SQL: {op}")
+
+    return clauses
+
+
+def translate_query(query: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """
+    Translates a build_query dict into a WHERE clause over
+    `properties p`, plus its parameters.
+    Example: {"status.tags": {"$all": ["PARK"]}} ->
+        EXISTS (SELECT 1 FROM property_tags a WHERE ... a.tag = ?), ['PARK']
+    """
+    clauses: List[str] = []
+    params: List[Any] = []
+
+    for path, condition in query.items():
+        if path in FIELD_COLUMNS:
+            clauses += _column_clause(FIELD_COLUMNS[path], condition, params)
+        elif path in ARRAY_TABLES:
+            table, column = ARRAY_TABLES[path]
+            clauses += _array_clause(table, column, condition, params)
+        else:
+            raise ValueError(f"Unsupported filter field for SQL: {path}")
+
+    return " AND ".join(clauses) or "1", params
+
+
+# -----------------------------
+# Relevance Ranking
+# -----------------------------
+
+def _recency_decay(age_days: Optional[float]) -> Optional[float]:
+    # exp(-ln2 * age / half_life): 1 today, 0.5 after one half-life
+    if age_days is None:
+        return None
+    return math.exp(-0.693147 / RECENCY_HALF_LIFE_DAYS * age_days)
+
+
+def build_score_sql(target_price: Optional[float] = None) -> Tuple[str, List[Any]]:
+    """
+    SQL twin of the MongoDB score expression (mongo/backend.py).
+    """
+    parts: List[str] = []
+    params: List[Any] = []
+
+    if target_price:
+        parts.append(
+            "? * (CASE WHEN p.asking_crore IS NULL THEN 0 "
+            "ELSE 1 - MIN(1, ABS(p.asking_crore - ?) / ?) END)"
+        )
+        params += [RANKING_WEIGHTS["price"], target_price, target_price]
+
+    parts.append(
+        "? * (SELECT COUNT(*) FROM property_tags t WHERE t.property_id = p.id "
+        f"AND t.tag IN ({_placeholders(len(RANKING_TAGS))})) / {len(RANKING_TAGS)}.0"
+    )
+    params += [RANKING_WEIGHTS["tags"], *RANKING_TAGS]
+
+    parts.append(
+        "? * COALESCE(recency_decay(julianday('now') - "
+        "julianday(COALESCE(p.listing_date, p.entry_date))), 0)"
+    )
+    params.append(RANKING_WEIGHTS["recency"])
+
+    return " + ".join(parts), params
+
+
+# -----------------------------
+# Documents
+# -----------------------------
+
+def _iso(value: Any) -> Optional[str]:
+    return value.isoformat() if isinstance(value, datetime) else None
+
+
+def _load_document(property_id: str, document_json: str) -> Dict[str, Any]:
+    doc = json.loads(document_json)
+    doc["_id"] = property_id
+
+    meta = doc.get("meta", {})
+    for key in ("entry_date", "listing_date"):
+        if isinstance(meta.get(key), str):
+            meta[key] = datetime.fromisoformat(meta[key])
+
+    return doc
+
+
+# -----------------------------
+# Backend
+# -----------------------------
+
+class SQLiteBackend(StorageBackend):
+    """
+    One connection per thread (API lookups run in worker threads).
+    Use a file path: each thread would get its own ':memory:' database.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or SQLITE_PATH
+        self._local = threading.local()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.create_function(
+                "recency_decay", 1, _recency_decay, deterministic=True
+            )
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+
+        return conn
+
+    def _select_sql(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        rank: bool,
+        target_price: Optional[float],
+        rendered: bool,
+    ) -> Tuple[str, List[Any]]:
+        payload = "p.result_json" if rendered else "p.document"
+        where, where_params = translate_query(query)
+
+        if rank:
+            score, score_params = build_score_sql(target_price)
+            sql = (
+                f"SELECT p.id, {payload}, {score} AS score FROM properties p "
+                f"WHERE {where} ORDER BY score DESC, p.id LIMIT ?"
+            )
+            return sql, score_params + where_params + [limit]
+
+        sql = f"SELECT p.id, {payload} FROM properties p WHERE {where} LIMIT ?"
+        return sql, where_params + [limit]
+
+    def find(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        rank: bool = False,
+        target_price: Optional[float] = None,
+        rendered: bool = False,
+    ) -> Iterable[Dict[str, Any]]:
+        sql, params = self._select_sql(query, limit, rank, target_price, rendered)
+
+        for row in self.conn.execute(sql, params):
+            if rendered:
+                yield {"_id": row[0], "rendered": {"result_json": row[1]}}
+            else:
+                yield _load_document(row[0], row[1])
+
+    def find_by_ids(self, ids: List[Any]) -> Iterable[Dict[str, Any]]:
+        sql = (
+            "SELECT id, document FROM properties "
+            f"WHERE id IN ({_placeholders(len(ids))})"
+        )
+        for row in self.conn.execute(sql, [str(i) for i in ids]):
+            yield _load_document(row[0], row[1])
+
+    def explain(
+        self,
+        query: Dict[str, Any],
+        limit: int,
+        rank: bool = False,
+        target_price: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        sql, params = self._select_sql(query, limit, rank, target_price, False)
+
+        plan = self.conn.execute("EXPLAIN QUERY PLAN " + sql, params).fetchall()
+
+        started = time.perf_counter()
+        returned = len(self.conn.execute(sql, params).fetchall())
+
+        return {
+            "keys_examined": None,
+            "docs_examined": None,
+            "returned": returned,
+            "execution_ms": round((time.perf_counter() - started) * 1000, 2),
+            "plan": [row[-1] for row in plan],
+            "sql": sql,
+        }
+
+    def insert_many(self, documents: List[Dict[str, Any]]) -> int:
+        with self.conn as conn:
+            for doc in documents:
+                if "rendered" not in doc:
+                    attach_rendered_result(doc)
+
+                property_id = str(doc["_id"])
+                stored = {k: v for k, v in doc.items() if k not in ("_id", "rendered")}
+
+                location = doc.get("location", {})
+                prop = doc.get("property", {})
+                pricing = doc.get("pricing", {})
+                meta = doc.get("meta", {})
+
+                conn.execute(
+                    "DELETE FROM property_floors WHERE property_id = ?", (property_id,)
+                )
+                conn.execute(
+                    "DELETE FROM property_tags WHERE property_id = ?", (property_id,)
+                )
+                conn.execute(
+                    "DELETE FROM property_terms WHERE property_id = ?", (property_id,)
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO properties ("
+                    "id, city, sector, block, pocket, bhk, area_category, "
+                    "asking_crore, net_crore, contact_role, listing_date, "
+                    "entry_date, document, result_json"
+                    ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        property_id,
+                        location.get("city"),
+                        location.get("sector"),
+                        location.get("block"),
+                        location.get("pocket"),
+                        prop.get("bhk_normalized"),
+                        prop.get("area_category"),
+                        pricing.get("asking_crore"),
+                        pricing.get("net_crore"),
+                        doc.get("contact", {}).get("role"),
+                        _iso(meta.get("listing_date")),
+                        _iso(meta.get("entry_date")),
+                        dumps_json(stored).decode("utf-8"),
+                        doc["rendered"]["result_json"],
+                    ),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO property_floors VALUES (?, ?)",
+                    [(property_id, f) for f in prop.get("floors") or []],
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO property_tags VALUES (?, ?)",
+                    [(property_id, t) for t in doc.get("status", {}).get("tags") or []],
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO property_terms VALUES (?, ?)",
+                    [(property_id, t) for t in doc.get("search", {}).get("terms") or []],
+                )
+
+        return len(documents)
+
+    def distinct(self, path: str) -> List[Any]:
+        if path in ARRAY_TABLES:
+            table, column = ARRAY_TABLES[path]
+            sql = f"SELECT DISTINCT {column} FROM {table}"
+        elif path in FIELD_COLUMNS:
+            column = FIELD_COLUMNS[path]
+            sql = f"SELECT DISTINCT {column} FROM properties WHERE {column} IS NOT NULL"
+        else:
+            raise ValueError(f"Unsupported field for SQL: {path}")
+
+        return [row[0] for row in self.conn.execute(sql)]
+
+    def ensure_indexes(self) -> None:
+        # Part of SCHEMA; idempotent
+        self.conn.executescript(SCHEMA)
+
+    def save_vocabulary(self, vocabulary: Dict[str, List[str]]) -> None:
+        with self.conn as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                (VOCABULARY_KEY, json.dumps(vocabulary)),
+            )
+
+    def load_vocabulary(self) -> Dict[str, List[str]] | None:
+        row = self.conn.execute(
+            "SELECT value FROM metadata WHERE key = ?", (VOCABULARY_KEY,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
@@ -0,0 +1,146 @@
+"""
+test_backend_parity.py
+
+Parity check: the same documents and build_query filters must give
+the same results on MongoDB and on the embedded SQLite backend.
+
+Needs MONGO_URI. Writes to a scratch collection and a temp SQLite
+file, both removed afterwards.
+Run from the repo root: python -m ai_core.db.test_backend_parity
+"""
+
+import copy
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+from ai_core.db.mongo.backend import MongoBackend
+from ai_core.db.mongo.client import get_db
+from ai_core.db.mongo.schemas import (
+    attach_rendered_result,
+    build_property_document,
+    build_result_summary,
+)
+from ai_core.db.sqlite.backend import SQLiteBackend
+from ai_core.tools.property_tool import build_query, ranking_target_price
+
+
+CSV_PATH = Path(__file__).parent / "mongo" / "FloorDataOrg.csv"
+SAMPLE_ROWS = 400
+SCRATCH_COLLECTION = "properties_parity_test"
+
+ALL = 100_000
+
+CASES = [
+    {},
+    {"city": "ROHINI"},
+    {"sector": "16", "block": "D"},
+    {"sector": "16", "block": "D", "pocket": "3"},
+    {"bhk": 3, "max_price": 1.5},
+    {"min_price": 1, "max_price": 2},
+    {"tags": ["MAP PASS"]},
+    {"tags": ["HOLD", "NO MAP"]},
+    {"floor": "FF"},
+    {"contact_role": "OWNER"},
+    {"listed_within_months": 24},
+    {"city": "ROHINI", "bhk": 2, "listed_within_months": 60},
+    {"text": "map pass"},
+    {"text": "visit"},
+    {"text": "no map", "city": "ROHINI", "bhk": 3},
+]
+
+
+def load_documents() -> list:
+    df = pd.read_csv(CSV_PATH, nrows=SAMPLE_ROWS)
+    rows = df.astype(object).where(df.notna(), None).to_dict("records")
+
+    documents = []
+    for row in rows:
+        row = {k: v.strip() if isinstance(v, str) else v for k, v in row.items()}
+        documents.append(attach_rendered_result(build_property_document(row)))
+    return documents
+
+
+def ids(docs) -> list:
+    return [str(doc["_id"]) for doc in docs]
+
+
+def check(label: str, mongo_value, sqlite_value) -> bool:
+    ok = mongo_value == sqlite_value
+    print(f"  {'✔' if ok else '✘'} {label}")
+    if not ok:
+        print(f"      mongo:  {mongo_value}")
+        print(f"      sqlite: {sqlite_value}")
+    return ok
+
+
+def run_parity() -> int:
+    documents = load_documents()
+
+    mongo = MongoBackend(collection=get_db()[SCRATCH_COLLECTION])
+    mongo.collection.drop()
+
+    sqlite_dir = tempfile.mkdtemp()
+    sqlite = SQLiteBackend(str(Path(sqlite_dir) / "parity.sqlite3"))
+
+    mongo.insert_many(copy.deepcopy(documents))
+    sqlite.insert_many(copy.deepcopy(documents))
+
+    failures = 0
+
+    try:
+        for case in CASES:
+            print(case)
+            query = build_query(**case)
+            target = ranking_target_price(case.get("min_price"), case.get("max_price"))
+
+            # Unranked order is backend-defined: compare the match sets
+            mongo_docs = list(mongo.find(query, ALL))
+            sqlite_docs = list(sqlite.find(query, ALL))
+            failures += not check(
+                f"matches ({len(mongo_docs)})",
+                sorted(ids(mongo_docs)),
+                sorted(ids(sqlite_docs)),
+            )
+
+            failures += not check(
+                "result summaries",
+                sorted((build_result_summary(d) for d in mongo_docs), key=lambda r: r["id"]),
+                sorted((build_result_summary(d) for d in sqlite_docs), key=lambda r: r["id"]),
+            )
+
+            # Ranked: same top-k in the same order
+            failures += not check(
+                "ranked top 5",
+                ids(mongo.find(query, 5, rank=True, target_price=target)),
+                ids(sqlite.find(query, 5, rank=True, target_price=target)),
+            )
+
+            # Pre-rendered payloads are byte-identical
+            failures += not check(
+                "rendered payloads",
+                {str(d["_id"]): d["rendered"]["result_json"]
+                 for d in mongo.find(query, ALL, rendered=True)},
+                {str(d["_id"]): d["rendered"]["result_json"]
+                 for d in sqlite.find(query, ALL, rendered=True)},
+            )
+
+        failures += not check(
+            "distinct sectors",
+            sorted(v for v in mongo.distinct("location.sector") if v is not None),
+            sorted(sqlite.distinct("location.sector")),
+        )
+
+    finally:
+        mongo.collection.drop()
+        shutil.rmtree(sqlite_dir)
+
+    print(f"\n{'✅ Parity OK' if not failures else f'❌ {failures} mismatches'}")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if run_parity() else 0)
@@ -0,0 +1,43 @@
+"""
+vocabulary.py
+
+Locality vocabulary: the distinct city / sector / block / pocket
+values found in the properties data.
+
+Stored through the storage backend so API processes can load it
+without scanning every property.
+"""
+
+from typing import Dict, List
+
+from .mongo.schemas import normalize_locality
+
+
+LOCALITY_FIELDS = {
+    "city": "location.city",
+    "sector": "location.sector",
+    "block": "location.block",
+    "pocket": "location.pocket",
+}
+
+
+def build_vocabulary(backend) -> Dict[str, List[str]]:
+    """
+    Collects distinct, normalized location values per locality field.
+    """
+    vocabulary: Dict[str, List[str]] = {}
+
+    for name, path in LOCALITY_FIELDS.items():
+        values = {normalize_locality(v) for v in backend.distinct(path)}
+        vocabulary[name] = sorted(v for v in values if v)
+
+    return vocabulary
+
+
+def refresh_vocabulary(backend) -> Dict[str, List[str]]:
+    """
+    Rebuilds and stores the vocabulary. Run after seeding.
+    """
+    vocabulary = build_vocabulary(backend)
+    backend.save_vocabulary(vocabulary)
+    return vocabulary
@@ -0,0 +1,77 @@
+"""
+bench_pipeline.py
+
+Offline time-to-first-audio benchmark for the voice pipeline,
+using fake STT / TTS backends and a fake property lookup.
+Run from the repo root: python -m ai_core.speech.bench_pipeline
+"""
+
+import asyncio
+import statistics
+import time
+
+from ai_core.speech.pipeline import VoicePipeline
+from ai_core.speech.stt.fake_stt import FakeSpeechToText
+from ai_core.speech.tts.fake_tts import FakeTextToSpeech
+
+
+RUNS = 5
+LOOKUP_SECONDS = 0.15
+
+QUERY = "show me 3 bhk in rohini sector 16 under 1.5 park facing"
+
+FAKE_RESULTS = [
+    {"bhk": 3, "city": "ROHINI", "sector": "16", "block": "D", "asking_price_crore": 1.35},
+    {"bhk": 3, "city": "ROHINI", "sector": "16", "block": "A", "asking_price_crore": 1.2},
+    {"bhk": 3, "city": "ROHINI", "sector": "16", "block": "F", "asking_price_crore": 1.45},
+]
+
+
+def fake_lookup(filters, limit, rank):
+    time.sleep(LOOKUP_SECONDS)  # stands in for the database round trip
+    return FAKE_RESULTS[:limit]
+
+
+async def measure(mode: str, final_text: str | None = None) -> tuple[float, float]:
+    """
+    Median (time to first audio, end-of-speech to first audio) in ms.
+    """
+    first_audio = []
+    after_speech = []
+
+    for _ in range(RUNS):
+        pipeline = VoicePipeline(
+            stt=FakeSpeechToText(QUERY, final_text=final_text),
+            tts=FakeTextToSpeech(),
+            lookup=fake_lookup,
+        )
+
+        stream = pipeline.run() if mode == "overlapped" else pipeline.run_sequential()
+        async for _ in stream:
+            pass
+
+        first_audio.append(pipeline.stats.time_to_first_audio * 1000)
+        after_speech.append(pipeline.stats.response_latency * 1000)
+
+    return statistics.median(first_audio), statistics.median(after_speech)
+
+
+async def main():
+    cases = [
+        ("sequential", None),
+        ("overlapped", None),
+        # Final transcript revised: speculative lookup is redone
+        ("overlapped", QUERY.replace("3 bhk", "2 bhk")),
+    ]
+
+    for mode, final_text in cases:
+        first_audio, after_speech = await measure(mode, final_text)
+        label = mode + (" (revised final)" if final_text else "")
+        print(
+            f"{label:28} first audio: {first_audio:.0f} ms, "
+            f"after end of speech: {after_speech:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
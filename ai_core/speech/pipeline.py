@@ -0,0 +1,241 @@
+"""
+pipeline.py
+
+End-to-end voice pipeline: speech -> property lookup -> spoken reply.
+
+Stages run concurrently as asyncio tasks connected by queues:
+
+    STT --(stable partial)--> speculative lookup
+        --(final)-----------> confirm / redo lookup --> reply sentences --> TTS
+
+- The lookup starts on a stable partial transcript, before end-of-speech.
+  If the final transcript parses to different filters, the speculative
+  lookup is cancelled and redone.
+- The first reply sentence is handed to TTS while later result
+  sentences are still being formatted.
+
+STT / TTS backends are pluggable (see stt/fake_stt.py, tts/fake_tts.py).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+)
+
+from ai_core.tools.intent_parser import parse_intent
+from ai_core.tools.reply_builder import iter_reply_sentences
+
+
+# -----------------------------
+# Backend Interfaces
+# -----------------------------
+
+@dataclass
+class TranscriptEvent:
+    text: str
+    is_final: bool
+    # Partial the recognizer is not expected to revise
+    stable: bool = False
+
+
+class SpeechToText(Protocol):
+    def transcribe(self, audio: Any) -> AsyncIterator[TranscriptEvent]:
+        ...
+
+
+class TextToSpeech(Protocol):
+    def synthesize(self, text: str) -> AsyncIterator[bytes]:
+        ...
+
+
+Lookup = Callable[..., List[Dict[str, Any]]]
+
+
+def _default_lookup(filters: Dict[str, Any], limit: int, rank: bool):
+    # Imported lazily so the pipeline can run offline with a fake lookup
+    from ai_core.tools.query_router import search_for_filters
+
+    return search_for_filters(filters, limit=limit, rank=rank)
+
+
+# -----------------------------
+# Timing
+# -----------------------------
+
+@dataclass
+class PipelineStats:
+    started: float = 0.0
+    final_transcript: Optional[float] = None
+    lookup_done: Optional[float] = None
+    first_audio: Optional[float] = None
+    finished: Optional[float] = None
+    # "none", "hit" (speculative result used) or "redo"
+    speculation: str = "none"
+    lookups_started: int = 0
+
+    @property
+    def time_to_first_audio(self) -> Optional[float]:
+        if self.first_audio is None:
+            return None
+        return self.first_audio - self.started
+
+    @property
+    def response_latency(self) -> Optional[float]:
+        """
+        End of speech to first audio: the delay the user actually hears.
+        """
+        if self.first_audio is None or self.final_transcript is None:
+            return None
+        return self.first_audio - self.final_transcript
+
+
+# -----------------------------
+# Pipeline
+# -----------------------------
+
+_DONE = None  # queue sentinel
+
+
+@dataclass
+class VoicePipeline:
+    stt: SpeechToText
+    tts: TextToSpeech
+    lookup: Lookup = _default_lookup
+    limit: int = 5
+    rank: bool = False
+    clock: Callable[[], float] = time.perf_counter
+    stats: PipelineStats = field(default_factory=PipelineStats)
+
+    async def _parse(self, text: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(parse_intent, text)
+
+    def _start_lookup(self, filters: Dict[str, Any]) -> asyncio.Task:
+        self.stats.lookups_started += 1
+        # A cancelled task stops waiting; the thread finishes on its own
+        return asyncio.create_task(asyncio.to_thread(
+            self.lookup, filters, limit=self.limit, rank=self.rank
+        ))
+
+    # --- Stage 1 + 2: transcript -> (speculative) lookup -> sentences ---
+
+    async def _listen_and_reply(self, audio: Any, sentences: asyncio.Queue):
+        speculative: Optional[asyncio.Task] = None
+        speculative_filters: Optional[Dict[str, Any]] = None
+        last_text = ""
+
+        try:
+            async for event in self.stt.transcribe(audio):
+                last_text = event.text
+
+                if event.is_final:
+                    break
+
+                if not event.stable:
+                    continue
+
+                filters = await self._parse(event.text)
+                if filters != speculative_filters:
+                    if speculative:
+                        speculative.cancel()
+                    speculative = self._start_lookup(filters)
+                    speculative_filters = filters
+
+            self.stats.final_transcript = self.clock()
+            if not last_text.strip():
+                return
+
+            final_filters = await self._parse(last_text)
+
+            if speculative and final_filters == speculative_filters:
+                self.stats.speculation = "hit"
+                lookup = speculative
+            else:
+                if speculative:
+                    self.stats.speculation = "redo"
+                    speculative.cancel()
+                lookup = self._start_lookup(final_filters)
+
+            results = await lookup
+            self.stats.lookup_done = self.clock()
+
+            for sentence in iter_reply_sentences(results):
+                await sentences.put(sentence)
+                # Let TTS pick up the sentence before formatting the next
+                await asyncio.sleep(0)
+
+        finally:
+            if speculative and not speculative.done():
+                speculative.cancel()
+            await sentences.put(_DONE)
+
+    # --- Stage 3: sentences -> audio ---
+
+    async def _speak(self, sentences: asyncio.Queue, audio_out: asyncio.Queue):
+        try:
+            while (sentence := await sentences.get()) is not _DONE:
+                async for chunk in self.tts.synthesize(sentence):
+                    await audio_out.put(chunk)
+        finally:
+            await audio_out.put(_DONE)
+
+    async def run(self, audio: Any = None) -> AsyncIterator[bytes]:
+        """
+        Streams reply audio chunks for one spoken query.
+        """
+        self.stats = PipelineStats(started=self.clock())
+
+        sentences: asyncio.Queue = asyncio.Queue()
+        audio_out: asyncio.Queue = asyncio.Queue()
+
+        stages = [
+            asyncio.create_task(self._listen_and_reply(audio, sentences)),
+            asyncio.create_task(self._speak(sentences, audio_out)),
+        ]
+
+        try:
+            while (chunk := await audio_out.get()) is not _DONE:
+                if self.stats.first_audio is None:
+                    self.stats.first_audio = self.clock()
+                yield chunk
+
+            # Surface stage errors
+            await asyncio.gather(*stages)
+            self.stats.finished = self.clock()
+        finally:
+            for stage in stages:
+                stage.cancel()
+
+    async def run_sequential(self, audio: Any = None) -> AsyncIterator[bytes]:
+        """
+        Baseline: STT, lookup, formatting and TTS strictly one after another.
+        """
+        self.stats = PipelineStats(started=self.clock())
+
+        text = ""
+        async for event in self.stt.transcribe(audio):
+            text = event.text
+            if event.is_final:
+                break
+        self.stats.final_transcript = self.clock()
+
+        filters = await self._parse(text)
+        results = await self._start_lookup(filters)
+        self.stats.lookup_done = self.clock()
+
+        reply = list(iter_reply_sentences(results))
+
+        for sentence in reply:
+            async for chunk in self.tts.synthesize(sentence):
+                if self.stats.first_audio is None:
+                    self.stats.first_audio = self.clock()
+                yield chunk
+
+        self.stats.finished = self.clock()
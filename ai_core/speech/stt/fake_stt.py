@@ -0,0 +1,47 @@
+"""
+fake_stt.py
+
+Scripted speech-to-text backend for offline tests and benchmarks.
+Emits word-by-word partial transcripts, then a final one.
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional
+
+from ai_core.speech.pipeline import TranscriptEvent
+
+
+class FakeSpeechToText:
+    """
+    Pretends the user speaks `text` one word every `word_delay` seconds.
+
+    The last partial is marked stable (the recognizer has heard the whole
+    utterance); the final arrives `endpoint_delay` later, like real
+    end-of-speech detection. `final_text` simulates a late revision.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        word_delay: float = 0.08,
+        endpoint_delay: float = 0.4,
+        final_text: Optional[str] = None,
+    ):
+        self.text = text
+        self.word_delay = word_delay
+        self.endpoint_delay = endpoint_delay
+        self.final_text = final_text or text
+
+    async def transcribe(self, audio) -> AsyncIterator[TranscriptEvent]:
+        words = self.text.split()
+
+        for i in range(1, len(words) + 1):
+            await asyncio.sleep(self.word_delay)
+            yield TranscriptEvent(
+                text=" ".join(words[:i]),
+                is_final=False,
+                stable=i == len(words),
+            )
+
+        await asyncio.sleep(self.endpoint_delay)
+        yield TranscriptEvent(text=self.final_text, is_final=True, stable=True)
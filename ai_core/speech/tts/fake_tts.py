@@ -0,0 +1,34 @@
+"""
+fake_tts.py
+
+Timed text-to-speech backend for offline tests and benchmarks.
+Produces silent audio chunks at a fixed speaking rate.
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+
+class FakeTextToSpeech:
+    """
+    Synthesizes `chunk_chars` characters per chunk, after a
+    `first_chunk_latency` warm-up, at `chars_per_second`.
+    """
+
+    def __init__(
+        self,
+        first_chunk_latency: float = 0.12,
+        chars_per_second: float = 400.0,
+        chunk_chars: int = 40,
+    ):
+        self.first_chunk_latency = first_chunk_latency
+        self.chars_per_second = chars_per_second
+        self.chunk_chars = chunk_chars
+
+    async def synthesize(self, text: str) -> AsyncIterator[bytes]:
+        await asyncio.sleep(self.first_chunk_latency)
+
+        for start in range(0, len(text), self.chunk_chars):
+            chunk = text[start:start + self.chunk_chars]
+            await asyncio.sleep(len(chunk) / self.chars_per_second)
+            yield b"\x00" * len(chunk)
@@ -0,0 +1,45 @@
+"""
+bench_ranking.py
+
+Times ranked (server-side top-k) search against the unranked
+first-N path, and prints the ranked plan.
+Run from the repo root: python -m ai_core.tools.bench_ranking
+"""
+
+import statistics
+import time
+
+from ai_core.tools.property_tool import explain_search, search_properties
+
+
+RUNS = 20
+
+CASES = [
+    {"city": "ROHINI", "limit": 5},
+    {"city": "ROHINI", "bhk": 3, "max_price": 1.5, "limit": 5},
+    {"sector": "16", "limit": 20},
+    {"limit": 50},
+]
+
+
+def time_search(runs: int, **kwargs) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        search_properties(**kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+for case in CASES:
+    unranked = time_search(RUNS, **case)
+    ranked = time_search(RUNS, rank=True, **case)
+
+    print(case)
+    print(f"  unranked: {unranked:.2f} ms (median of {RUNS})")
+    print(f"  ranked:   {ranked:.2f} ms (median of {RUNS})")
+
+    explain = explain_search(rank=True, **case)["explain"]
+    print(f"  ranked plan: {explain['plan']}")
+    print(f"  ranked docs examined: {explain['docs_examined']}")
+    print("-" * 40)
@@ -0,0 +1,96 @@
+"""
+bench_rendering.py
+
+CPU cost of building the /query response body, per request:
+- dict path: result summaries -> build_response_payload ->
+  QueryResponse validation -> JSON encoding (what FastAPI does
+  with response_model)
+- pre-rendered path: stored fragments -> build_rendered_payload,
+  spliced into the response bytes
+
+Works offline on documents built from the CSV; the database fetch
+is not included in either path.
+Run from the repo root: python -m ai_core.tools.bench_rendering
+"""
+
+import statistics
+import time
+from pathlib import Path
+
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from ai_core.api.main import QueryResponse, _prerendered_response
+from ai_core.db.mongo.schemas import (
+    attach_rendered_result,
+    build_property_document,
+    build_result_summary,
+)
+from ai_core.tools.query_router import build_response_payload
+from ai_core.tools.reply_builder import build_reply_text
+
+
+CSV_PATH = Path(__file__).parent.parent / "db" / "mongo" / "FloorDataOrg.csv"
+
+RUNS = 200
+LIMITS = [5, 50, 200]
+
+TEXT = "show me 3 bhk in rohini sector 16 under 1.5"
+FILTERS = {"bhk": 3, "max_price": 1.5, "city": "ROHINI", "sector": "16"}
+
+
+def load_documents(count: int) -> list:
+    df = pd.read_csv(CSV_PATH, nrows=count)
+    rows = df.astype(object).where(df.notna(), None).to_dict("records")
+
+    documents = []
+    for row in rows:
+        row = {k: v.strip() if isinstance(v, str) else v for k, v in row.items()}
+        documents.append(attach_rendered_result(build_property_document(row)))
+    return documents
+
+
+def dict_response(documents: list) -> bytes:
+    results = [build_result_summary(doc) for doc in documents]
+    data = build_response_payload(TEXT, FILTERS, results)
+
+    response = QueryResponse(
+        status="success",
+        reply_text=build_reply_text(len(results)),
+        data=data,
+    )
+    return JSONResponse(jsonable_encoder(response)).body
+
+
+def rendered_response(documents: list) -> bytes:
+    fragments = [doc["rendered"]["result_json"] for doc in documents]
+    return _prerendered_response(TEXT, FILTERS, fragments).body
+
+
+def cpu_per_request(build, documents: list) -> float:
+    """
+    Median CPU time of one response, in ms.
+    """
+    timings = []
+    for _ in range(RUNS):
+        start = time.process_time_ns()
+        build(documents)
+        timings.append((time.process_time_ns() - start) / 1e6)
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    documents = load_documents(max(LIMITS))
+
+    for limit in LIMITS:
+        docs = documents[:limit]
+
+        as_dicts = cpu_per_request(dict_response, docs)
+        rendered = cpu_per_request(rendered_response, docs)
+
+        print(f"limit={limit}")
+        print(f"  dict + pydantic: {as_dicts:.3f} ms CPU (median of {RUNS})")
+        print(f"  pre-rendered:    {rendered:.3f} ms CPU (median of {RUNS})")
+        print(f"  speedup:         {as_dicts / rendered:.1f}x")
+        print("-" * 40)
@@ -8,6 +8,8 @@ Fast, cheap, deterministic.
 import re
 from typing import Dict, Any, List
 
+from ai_core.tools.locality_index import get_locality_matcher
+
 
 # -----------------------------
 # Keyword Dictionaries
@@ -53,6 +55,28 @@ def extract_city(text: str) -> str | None:
     return None
 
 
+def extract_locality(text: str) -> Dict[str, str]:
+    """
+    City / sector / block / pocket from the locality vocabulary.
+    """
+    return get_locality_matcher().match(text)
+
+
+def extract_listed_within_months(text: str) -> int | None:
+    """
+    'listed in the last 6 months' -> 6, 'past 2 years' -> 24, 'last month' -> 1
+    """
+    match = re.search(r"(?:last|past)\s+(\d+)?\s*(month|year)s?", text)
+    if not match:
+        return None
+
+    count = int(match.group(1)) if match.group(1) else 1
+    if match.group(2) == "year":
+        count *= 12
+
+    return count or None
+
+
 def extract_area_category(text: str) -> str | None:
     for area in AREA_KEYWORDS:
         if area.lower() in text:
@@ -68,6 +92,15 @@ def extract_tags(text: str) -> List[str]:
     return tags
 
 
+def extract_search_text(text: str) -> str | None:
+    """
+    Quoted phrases go to full-text search:
+    'flats from "sharma properties"' -> 'sharma properties'
+    """
+    phrases = re.findall(r"[\"“”]([^\"“”]+)[\"“”]", text)
+    return " ".join(p.strip() for p in phrases) or None
+
+
 # -----------------------------
 # Main Parser
 # -----------------------------
@@ -89,10 +122,20 @@ def parse_intent(user_text: str) -> Dict[str, Any]:
     if price:
         filters["max_price"] = price
 
-    city = extract_city(text)
+    locality = extract_locality(text)
+
+    city = locality.get("city") or extract_city(text)
     if city:
         filters["city"] = city
 
+    for field in ("sector", "block", "pocket"):
+        if locality.get(field):
+            filters[field] = locality[field]
+
+    months = extract_listed_within_months(text)
+    if months:
+        filters["listed_within_months"] = months
+
     area = extract_area_category(text)
     if area:
         filters["area_category"] = area
@@ -101,4 +144,8 @@ def parse_intent(user_text: str) -> Dict[str, Any]:
     if tags:
         filters["tags"] = tags
 
+    search_text = extract_search_text(text)
+    if search_text:
+        filters["text"] = search_text
+
     return filters
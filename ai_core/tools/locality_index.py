@@ -0,0 +1,256 @@
+"""
+locality_index.py
+
+Compiled matcher for locality mentions in user text:
+city, sector, block and pocket.
+
+Built from the locality vocabulary stored at seed time.
+Tolerates one-character typos in city names and vocabulary values
+("rohni"); keywords only match the forms listed below, so ordinary
+words ("black d", "clock 5") don't become filters.
+"""
+
+import re
+import threading
+import time
+from typing import Dict, List, Set, Iterable
+
+from ai_core.config.settings import LOCALITY_VOCABULARY_TTL_SECONDS
+
+
+# -----------------------------
+# Keyword Dictionaries
+# -----------------------------
+
+# Spoken / written forms of each locality field, matched exactly
+LOCALITY_KEYWORDS = {
+    "sector": ["sector", "sectors", "sec", "sect", "secter"],
+    "block": ["block", "blocks", "blk", "blok"],
+    "pocket": ["pocket", "pockets", "pkt", "pockt"],
+}
+
+KEYWORD_FIELDS = {
+    word: field
+    for field, words in LOCALITY_KEYWORDS.items()
+    for word in words
+}
+
+# Shorter terms are only matched exactly, too many false positives otherwise
+MIN_FUZZY_LENGTH = 5
+
+# Hyphens stay inside tokens: pocket "19-20"
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:-[a-z0-9]+)*")
+# "sec16", "sector-16"
+GLUED_PATTERN = re.compile(
+    r"^(" + "|".join(sorted(KEYWORD_FIELDS, key=len, reverse=True)) + r")-?(\d+)$"
+)
+
+# "16", "19-20", "d", "a3" -- but not "in", "of"
+VALUE_PATTERN = re.compile(r"\d+(?:-\d+)?|[a-z]\d*")
+
+
+# -----------------------------
+# Edit Distance Helpers
+# -----------------------------
+
+def _deletions(term: str) -> Set[str]:
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """
+    True if a and b differ by at most one insert, delete or substitution.
+    """
+    if a == b:
+        return True
+
+    if abs(len(a) - len(b)) > 1:
+        return False
+
+    if len(a) > len(b):
+        a, b = b, a
+
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+
+    return a[i:] == b[i + 1:]
+
+
+class FuzzyTermIndex:
+    """
+    Symmetric-delete index: every term and its one-char deletions
+    map back to the term, so a lookup only touches a few buckets
+    instead of comparing against the whole vocabulary.
+    """
+
+    def __init__(self, terms: Iterable[str]):
+        self.exact: Dict[str, str] = {}
+        self.variants: Dict[str, Set[str]] = {}
+
+        for term in terms:
+            self.add(term, term)
+
+    def add(self, key: str, value: str) -> None:
+        key = key.lower()
+        self.exact.setdefault(key, value)
+
+        if len(key) >= MIN_FUZZY_LENGTH:
+            for variant in _deletions(key) | {key}:
+                self.variants.setdefault(variant, set()).add(key)
+
+    def lookup(self, word: str) -> str | None:
+        if word in self.exact:
+            return self.exact[word]
+
+        if len(word) < MIN_FUZZY_LENGTH - 1:
+            return None
+
+        candidates: Set[str] = set()
+        for variant in _deletions(word) | {word}:
+            candidates |= self.variants.get(variant, set())
+
+        matches = sorted(c for c in candidates if within_one_edit(word, c))
+        if not matches:
+            return None
+
+        return self.exact[matches[0]]
+
+
+# -----------------------------
+# Locality Matcher
+# -----------------------------
+
+class LocalityMatcher:
+    """
+    Extracts city / sector / block / pocket filters from text.
+    Values come back in stored form: 'ROHINI', '16', 'D', '3'.
+    """
+
+    def __init__(self, vocabulary: Dict[str, List[str]]):
+        cities = vocabulary.get("city", [])
+
+        self.cities = FuzzyTermIndex([])
+        for city in cities:
+            self.cities.add(city, city)
+            # "pitampura" for "PITAM PURA"
+            self.cities.add(city.replace(" ", ""), city)
+
+        self.max_city_words = max(
+            (len(city.split()) for city in cities), default=1
+        )
+
+        self.values = {
+            field: FuzzyTermIndex(vocabulary.get(field, []))
+            for field in LOCALITY_KEYWORDS
+        }
+
+    def _tokenize(self, text: str) -> List[str]:
+        tokens = []
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            glued = GLUED_PATTERN.match(token)
+            if glued:
+                tokens.extend(glued.groups())
+            else:
+                tokens.append(token)
+        return tokens
+
+    def match(self, text: str) -> Dict[str, str]:
+        tokens = self._tokenize(text)
+        found: Dict[str, str] = {}
+        used: Set[int] = set()
+
+        # Keyword-anchored values: "sector 16", "block d", "pkt 3"
+        for i in range(len(tokens) - 1):
+            field = KEYWORD_FIELDS.get(tokens[i])
+            if not field or field in found:
+                continue
+
+            raw = tokens[i + 1]
+            value = self.values[field].lookup(raw)
+
+            # Unknown to the vocabulary, but shaped like a locality value
+            if value is None and VALUE_PATTERN.fullmatch(raw):
+                value = raw.upper()
+
+            if value is not None:
+                found[field] = value
+                used.update((i, i + 1))
+
+        # City names, longest phrase first
+        for size in range(self.max_city_words, 0, -1):
+            if "city" in found:
+                break
+
+            for i in range(len(tokens) - size + 1):
+                span = set(range(i, i + size))
+                if span & used:
+                    continue
+
+                city = self.cities.lookup(" ".join(tokens[i:i + size]))
+                if city:
+                    found["city"] = city
+                    break
+
+        return found
+
+
+# -----------------------------
+# Cached Matcher
+# -----------------------------
+
+_matcher: LocalityMatcher | None = None
+_loaded_at = 0.0
+_reload_lock = threading.Lock()
+
+
+def _load_vocabulary() -> Dict[str, List[str]] | None:
+    """
+    Loads the stored vocabulary. None when the database is not
+    configured or unreachable.
+    """
+    try:
+        from ai_core.db.backend import get_backend
+
+        return get_backend().load_vocabulary() or {}
+    except Exception:
+        return None
+
+
+def _reload() -> None:
+    global _matcher, _loaded_at
+
+    vocabulary = _load_vocabulary()
+
+    # Keep the previous matcher through a database outage
+    if vocabulary is not None or _matcher is None:
+        _matcher = LocalityMatcher(vocabulary or {})
+    _loaded_at = time.monotonic()
+
+
+def get_locality_matcher() -> LocalityMatcher:
+    """
+    Returns the compiled matcher, reloading the vocabulary
+    once it is older than LOCALITY_VOCABULARY_TTL_SECONDS.
+
+    One thread reloads; the others keep using the current matcher
+    meanwhile instead of each hitting the database.
+    """
+    if _matcher is None:
+        with _reload_lock:
+            if _matcher is None:
+                _reload()
+        return _matcher
+
+    if time.monotonic() - _loaded_at > LOCALITY_VOCABULARY_TTL_SECONDS:
+        if _reload_lock.acquire(blocking=False):
+            try:
+                if time.monotonic() - _loaded_at > LOCALITY_VOCABULARY_TTL_SECONDS:
+                    _reload()
+            finally:
+                _reload_lock.release()
+
+    return _matcher
@@ -3,11 +3,25 @@ property_tool.py
 
 Core property search tool.
 This is the ONLY way AI is allowed to read property data.
+
+Storage is pluggable (ai_core/db/backend.py): MongoDB by default,
+or an embedded SQLite file.
 """
 
+import json
+import re
+from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from ai_core.db.mongo.client import get_properties_collection
+from bson import json_util
+
+from ai_core.db.backend import get_backend
+from ai_core.db.mongo.schemas import (
+    build_result_summary,
+    months_before,
+    render_result_json,
+    tokenize_search_text,
+)
 
 
 # -----------------------------
@@ -16,6 +30,9 @@ from ai_core.db.mongo.client import get_properties_collection
 
 def build_query(
     city: Optional[str] = None,
+    sector: Optional[str] = None,
+    block: Optional[str] = None,
+    pocket: Optional[str] = None,
     bhk: Optional[int] = None,
     max_price: Optional[float] = None,
     min_price: Optional[float] = None,
@@ -23,9 +40,15 @@ def build_query(
     floor: Optional[str] = None,
     contact_role: Optional[str] = None,
     tags: Optional[List[str]] = None,
+    listed_within_months: Optional[int] = None,
+    text: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Build a MongoDB query dict based on provided filters.
+
+    `text` matches remarks, contact / office names, channel and status
+    tags: every word must prefix-match an indexed term
+    ("shar" finds SHARMA).
     """
 
     query: Dict[str, Any] = {}
@@ -33,6 +56,15 @@ def build_query(
     if city:
         query["location.city"] = city.upper()
 
+    if sector:
+        query["location.sector"] = str(sector).upper()
+
+    if block:
+        query["location.block"] = str(block).upper()
+
+    if pocket:
+        query["location.pocket"] = str(pocket).upper()
+
     if bhk is not None:
         query["property.bhk_normalized"] = bhk
 
@@ -58,15 +90,49 @@ def build_query(
             "$all": [t.upper() for t in tags]
         }
 
+    if listed_within_months:
+        query["meta.listing_date"] = {
+            "$gte": months_before(datetime.utcnow(), listed_within_months)
+        }
+
+    if text:
+        terms = tokenize_search_text(text)
+        if terms:
+            # Anchored, case-sensitive prefixes: index range scans, no collection scan
+            query["search.terms"] = {
+                "$all": [re.compile("^" + re.escape(t)) for t in terms]
+            }
+
     return query
 
 
+# -----------------------------
+# Relevance Ranking
+# -----------------------------
+
+def ranking_target_price(
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+) -> float | None:
+    """
+    The price a ranked search scores closeness against.
+    """
+    if min_price is not None and max_price is not None:
+        return (min_price + max_price) / 2
+    if max_price is not None:
+        return max_price
+    return min_price
+
+
 # -----------------------------
 # Public Search API
 # -----------------------------
 
 def search_properties(
     city: Optional[str] = None,
+    sector: Optional[str] = None,
+    block: Optional[str] = None,
+    pocket: Optional[str] = None,
     bhk: Optional[int] = None,
     max_price: Optional[float] = None,
     min_price: Optional[float] = None,
@@ -74,17 +140,27 @@ def search_properties(
     floor: Optional[str] = None,
     contact_role: Optional[str] = None,
     tags: Optional[List[str]] = None,
+    listed_within_months: Optional[int] = None,
+    text: Optional[str] = None,
     limit: int = 10,
+    rank: bool = False,
 ) -> List[Dict[str, Any]]:
     """
     Search properties based on structured filters.
     Returns AI-friendly results only.
+
+    rank=True returns the `limit` best matches by relevance score
+    (price closeness, PARK / CORNER tags, recency; computed by the
+    backend) instead of the first `limit` found.
     """
 
-    collection = get_properties_collection()
+    backend = get_backend()
 
     query = build_query(
         city=city,
+        sector=sector,
+        block=block,
+        pocket=pocket,
         bhk=bhk,
         max_price=max_price,
         min_price=min_price,
@@ -92,36 +168,89 @@ def search_properties(
         floor=floor,
         contact_role=contact_role,
         tags=tags,
+        listed_within_months=listed_within_months,
+        text=text,
     )
 
-    cursor = (
-        collection
-        .find(query)
-        .limit(limit)
+    cursor = backend.find(
+        query,
+        limit,
+        rank=rank,
+        target_price=ranking_target_price(min_price, max_price),
     )
 
-    results = []
+    return [build_result_summary(doc) for doc in cursor]
+
+
+def search_properties_rendered(
+    limit: int = 10,
+    rank: bool = False,
+    **filters,
+) -> List[bytes]:
+    """
+    Same search as search_properties, but returns each result as
+    pre-rendered JSON bytes. Only the stored payload leaves the server.
+    Accepts the same filters as search_properties.
+    """
+
+    backend = get_backend()
+
+    query = build_query(**filters)
+
+    cursor = backend.find(
+        query,
+        limit,
+        rank=rank,
+        target_price=ranking_target_price(
+            filters.get("min_price"), filters.get("max_price")
+        ),
+        rendered=True,
+    )
+
+    fragments: List[bytes | None] = []
+    missing: Dict[Any, int] = {}
 
     for doc in cursor:
-        results.append({
-            "id": str(doc["_id"]),
-            "city": doc["location"].get("city"),
-            "sector": doc["location"].get("sector"),
-            "block": doc["location"].get("block"),
-            "pocket": doc["location"].get("pocket"),
-            "house_number": doc["location"].get("house_number"),
+        payload = doc.get("rendered", {}).get("result_json")
+        if payload is None:
+            missing[doc["_id"]] = len(fragments)
+        fragments.append(payload)
+
+    # Documents seeded before pre-rendering: render them on the fly
+    if missing:
+        for doc in backend.find_by_ids(list(missing)):
+            fragments[missing[doc["_id"]]] = render_result_json(doc)
+
+    return [f for f in fragments if f is not None]
 
-            "bhk": doc["property"].get("bhk_normalized"),
-            "area_category": doc["property"].get("area_category"),
-            "floors": doc["property"].get("floors"),
 
-            "asking_price_crore": doc["pricing"].get("asking_crore"),
+# -----------------------------
+# Query Diagnostics
+# -----------------------------
 
-            "contact_name": doc["contact"].get("name"),
-            "contact_role": doc["contact"].get("role"),
-            "contact_mobile": doc["contact"].get("primary_mobile"),
+def query_to_json(query: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The query as plain JSON that can be pasted back into the mongo shell:
+    regexes become {"$regex": ...}, dates {"$date": ...}.
+    """
+    return json.loads(
+        json_util.dumps(query, json_options=json_util.LEGACY_JSON_OPTIONS)
+    )
+
+
+def explain_search(limit: int = 10, rank: bool = False, **filters) -> Dict[str, Any]:
+    """
+    Explains the search that search_properties would run with
+    these filters (explain("executionStats") on MongoDB).
+    Returns the generated query (as query_to_json) and a summary of the plan.
+    """
+
+    query = build_query(**filters)
+
+    target_price = ranking_target_price(
+        filters.get("min_price"), filters.get("max_price")
+    )
 
-            "tags": doc["status"].get("tags", []),
-        })
+    explain = get_backend().explain(query, limit, rank=rank, target_price=target_price)
 
-    return results
+    return {"query": query_to_json(query), "explain": explain}
@@ -4,42 +4,147 @@ query_router.py
 Routes user queries to the correct tools.
 This is the single entry point for text-based queries.
 """
-from typing import Dict, Any
+import json
+from typing import Dict, Any, List
 
+from ai_core.db.mongo.schemas import dumps_json, tokenize_search_text
 from ai_core.tools.intent_parser import parse_intent
-from ai_core.tools.property_tool import search_properties
+from ai_core.tools.property_tool import (
+    build_query,
+    explain_search,
+    query_to_json,
+    search_properties,
+    search_properties_rendered,
+)
 
 
 
 # -----------------------------
-# Main Router
+# Filter Search
 # -----------------------------
 
-def handle_user_query(user_text: str, limit: int = 5) -> Dict[str, Any]:
+def _search_kwargs(filters: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Takes raw user text and returns structured results.
+    Maps parse_intent filters onto search_properties arguments.
     """
+    return {
+        "city": filters.get("city"),
+        "sector": filters.get("sector"),
+        "block": filters.get("block"),
+        "pocket": filters.get("pocket"),
+        "bhk": filters.get("bhk"),
+        "min_price": filters.get("min_price"),
+        "max_price": filters.get("max_price"),
+        "area_category": filters.get("area_category"),
+        "tags": filters.get("tags"),
+        "listed_within_months": filters.get("listed_within_months"),
+        "text": filters.get("text"),
+    }
 
-    # Step 1: Parse intent
-    filters = parse_intent(user_text)
 
-    # Step 2: Query database via tool
-    results = search_properties(
-        city=filters.get("city"),
-        bhk=filters.get("bhk"),
-        min_price=filters.get("min_price"),
-        max_price=filters.get("max_price"),
-        area_category=filters.get("area_category"),
-        tags=filters.get("tags"),
-        limit=limit,
+def canonical_filters_key(filters: Dict[str, Any], limit: int, rank: bool) -> str:
+    """
+    Stable key for a lookup: differently worded queries that parse
+    to the same filters share it.
+    """
+    canonical = {k: v for k, v in _search_kwargs(filters).items() if v is not None}
+    if canonical.get("tags"):
+        canonical["tags"] = sorted(canonical["tags"])
+    if canonical.get("text"):
+        canonical["text"] = sorted(tokenize_search_text(canonical["text"]))
+
+    return json.dumps(
+        {"filters": canonical, "limit": limit, "rank": rank},
+        sort_keys=True,
+        default=str,
     )
 
-    # Step 3: Prepare response payload
-    response = {
+
+def search_for_filters(
+    filters: Dict[str, Any],
+    limit: int = 5,
+    rank: bool = False,
+) -> List[Dict[str, Any]]:
+    return search_properties(**_search_kwargs(filters), limit=limit, rank=rank)
+
+
+def search_for_filters_rendered(
+    filters: Dict[str, Any],
+    limit: int = 5,
+    rank: bool = False,
+) -> List[bytes]:
+    return search_properties_rendered(
+        **_search_kwargs(filters), limit=limit, rank=rank
+    )
+
+
+def query_for_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The database query these filters generate, as query_to_json.
+    """
+    return query_to_json(build_query(**_search_kwargs(filters)))
+
+
+def explain_for_filters(
+    filters: Dict[str, Any],
+    limit: int = 5,
+    rank: bool = False,
+) -> Dict[str, Any]:
+    return explain_search(**_search_kwargs(filters), limit=limit, rank=rank)
+
+
+# -----------------------------
+# Response Payloads
+# -----------------------------
+
+def build_response_payload(
+    user_text: str,
+    filters: Dict[str, Any],
+    results: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    return {
         "query": user_text,
         "filters_used": filters,
         "result_count": len(results),
         "results": results,
     }
 
-    return response
+
+def build_rendered_payload(
+    user_text: str,
+    filters: Dict[str, Any],
+    fragments: List[bytes],
+) -> bytes:
+    """
+    JSON bytes of build_response_payload, with results spliced in
+    from their pre-rendered fragments (no per-result dicts are built).
+    """
+    return b"".join([
+        b'{"query":', dumps_json(user_text),
+        b',"filters_used":', dumps_json(filters),
+        b',"result_count":', str(len(fragments)).encode(),
+        b',"results":[', b",".join(fragments), b"]}",
+    ])
+
+
+# -----------------------------
+# Main Router
+# -----------------------------
+
+def handle_user_query(
+    user_text: str,
+    limit: int = 5,
+    rank: bool = False,
+) -> Dict[str, Any]:
+    """
+    Takes raw user text and returns structured results.
+    """
+
+    # Step 1: Parse intent
+    filters = parse_intent(user_text)
+
+    # Step 2: Query database via tool
+    results = search_for_filters(filters, limit=limit, rank=rank)
+
+    # Step 3: Prepare response payload
+    return build_response_payload(user_text, filters, results)
@@ -0,0 +1,66 @@
+"""
+reply_builder.py
+
+Turns search results into reply text, sentence by sentence,
+so speech output can start before the whole reply is formatted.
+"""
+
+from typing import Any, Dict, Iterator, List
+
+
+# -----------------------------
+# Sentences
+# -----------------------------
+
+def build_reply_text(result_count: int) -> str:
+    """
+    Short spoken/written reply for a result count.
+    """
+    if result_count == 0:
+        return (
+            "I couldn’t find any exact matches for your request. "
+            "Would you like to broaden the criteria?"
+        )
+
+    return (
+        f"I found {result_count} matching properties. "
+        "Here are some good options."
+    )
+
+
+def build_result_sentence(index: int, result: Dict[str, Any]) -> str:
+    """
+    One spoken sentence describing a search result.
+    Example: 'Option 1: a 3 BHK in sector 16, block D, Rohini, asking 1.35.'
+    """
+    parts = []
+
+    if result.get("bhk"):
+        parts.append(f"a {result['bhk']} BHK")
+    else:
+        parts.append("a property")
+
+    place = []
+    if result.get("sector"):
+        place.append(f"sector {result['sector']}")
+    if result.get("block"):
+        place.append(f"block {result['block']}")
+    if result.get("city"):
+        place.append(str(result["city"]).title())
+    if place:
+        parts.append("in " + ", ".join(place))
+
+    if result.get("asking_price_crore") is not None:
+        parts.append(f"asking {result['asking_price_crore']}")
+
+    return f"Option {index}: " + " ".join(parts) + "."
+
+
+def iter_reply_sentences(results: List[Dict[str, Any]]) -> Iterator[str]:
+    """
+    Yields the summary first, then one sentence per result.
+    """
+    yield build_reply_text(len(results))
+
+    for index, result in enumerate(results, start=1):
+        yield build_result_sentence(index, result)
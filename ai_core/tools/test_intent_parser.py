@@ -4,6 +4,9 @@ queries = [
     "show me 2 bhk in rohini under 1.5 crore park facing",
     "need 3 bhk dwarka under 2",
     "commercial property in noida",
+    "3 bhk in rohni secter 16 block D",
+    "2 bhk in rohini listed in the last 6 months",
+    'rohini listings that say "map pass"',
 ]
 
 for q in queries:
@@ -0,0 +1,122 @@
+"""
+test_locality_index.py
+
+Checks LocalityMatcher against a fixed vocabulary, and that an
+expired vocabulary is reloaded by one thread while the others keep
+using the current matcher.
+
+No database needed.
+Run from the repo root: python -m ai_core.tools.test_locality_index
+"""
+
+import sys
+import threading
+import time
+
+from ai_core.tools import locality_index
+from ai_core.tools.locality_index import LocalityMatcher
+
+
+VOCABULARY = {
+    "city": ["ROHINI", "PITAM PURA", "SHALIMAR BAGH"],
+    "sector": ["11", "16", "24"],
+    "block": ["A", "B", "D", "GH"],
+    "pocket": ["3", "10", "19-20"],
+}
+
+CASES = [
+    ("3 bhk in rohini sector 16 block d", {"city": "ROHINI", "sector": "16", "block": "D"}),
+    ("3 bhk in rohni secter 16 block D", {"city": "ROHINI", "sector": "16", "block": "D"}),
+    ("sec16 blk gh pkt 3", {"sector": "16", "block": "GH", "pocket": "3"}),
+    ("sector-24 pitampura", {"sector": "24", "city": "PITAM PURA"}),
+    ("flat in shalimar bagh", {"city": "SHALIMAR BAGH"}),
+    ("pocket 19-20 rohini", {"pocket": "19-20", "city": "ROHINI"}),
+    ("blocks a", {"block": "A"}),
+    # Shaped like a value, not yet in the vocabulary
+    ("sector 9", {"sector": "9"}),
+    # Ordinary words must not turn into filters
+    ("any black d property", {}),
+    ("clock 5", {}),
+    ("sector in rohini", {"city": "ROHINI"}),
+    ("2 bhk under 1 crore", {}),
+]
+
+
+def check(label: str, ok: bool) -> bool:
+    print(f"  {'✔' if ok else '✘'} {label}")
+    return ok
+
+
+def check_matches() -> int:
+    print("matches")
+    matcher = LocalityMatcher(VOCABULARY)
+
+    failures = 0
+    for text, expected in CASES:
+        found = matcher.match(text)
+        failures += not check(f"{text!r} -> {found}", found == expected)
+    return failures
+
+
+def check_reload() -> int:
+    print("reload")
+    loads = []
+
+    def slow_load():
+        loads.append(1)
+        time.sleep(0.2)
+        return {"city": ["ROHINI", "NOIDA"]}
+
+    original_load = locality_index._load_vocabulary
+    locality_index._load_vocabulary = slow_load
+    try:
+        current = LocalityMatcher(VOCABULARY)
+        locality_index._matcher = current
+        locality_index._loaded_at = 0.0  # expired
+
+        served = []
+        waits = []
+
+        def worker():
+            started = time.monotonic()
+            served.append(locality_index.get_locality_matcher())
+            waits.append(time.monotonic() - started)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        failures = 0
+        failures += not check("one thread reloads", len(loads) == 1)
+        failures += not check(
+            "others keep the current matcher without waiting",
+            sum(m is current for m in served) == 7 and sorted(waits)[6] < 0.1,
+        )
+        failures += not check(
+            "new vocabulary in use afterwards",
+            locality_index.get_locality_matcher().match("noida") == {"city": "NOIDA"},
+        )
+
+        # Database unreachable: keep what we have
+        locality_index._load_vocabulary = lambda: None
+        locality_index._loaded_at = 0.0
+        failures += not check(
+            "outage keeps the previous matcher",
+            locality_index.get_locality_matcher().match("noida") == {"city": "NOIDA"},
+        )
+        return failures
+    finally:
+        locality_index._load_vocabulary = original_load
+        locality_index._matcher = None
+
+
+def run_tests() -> int:
+    failures = check_matches() + check_reload()
+    print(f"\n{'✅ All checks passed' if not failures else f'❌ {failures} failed'}")
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if run_tests() else 0)